@@ -208,6 +208,16 @@ class RawPosition(SpyglassMixin, dj.Imported):
                 for pos_id, rp in id_rp
             ]
 
+            # Series usually share one time index: then a single concat
+            # matches the pairwise merges. Otherwise, merge to keep duplicate
+            # timestamps and suffix repeated column names, as before.
+            first_index = df_list[0].index
+            columns = [col for df in df_list for col in df.columns]
+            if len(set(columns)) == len(columns) and all(
+                df.index.is_unique and df.index.equals(first_index)
+                for df in df_list
+            ):
+                return pd.concat(df_list, axis=1)
             return reduce(lambda x, y: pd.merge(x, y, on="time"), df_list)
 
         @staticmethod
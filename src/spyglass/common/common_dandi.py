@@ -1,5 +1,6 @@
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import datajoint as dj
@@ -42,6 +43,9 @@ except (ImportError, ModuleNotFoundError) as e:
 
 schema = dj.schema("common_dandi")
 
+# dandi.validate message for files outside the validated folder
+EXTERNAL_FILE_ERROR_PREFIX = "Path is not inside"
+
 
 @schema
 class DandiPath(SpyglassMixin, dj.Manual):
@@ -54,8 +58,30 @@ class DandiPath(SpyglassMixin, dj.Manual):
     dandi_instance = "dandi": varchar(32)
     """
 
-    def fetch_file_from_dandi(self, key: dict):
-        """Fetch the file from Dandi and return the NWB file object."""
+    # HDF5 chunk cache per dataset for streamed files. The h5py default of
+    # 1 MB drops larger chunks, forcing a new s3 request on each access.
+    DEFAULT_RDCC_NBYTES = 32 * 1024 * 1024
+
+    def fetch_file_from_dandi(
+        self,
+        key: dict,
+        block_size: int = 8 * 1024 * 1024,
+        rdcc_nbytes: int = None,
+    ):
+        """Fetch the file from Dandi and return the NWB file object.
+
+        Parameters
+        ----------
+        key : dict
+            Restriction identifying a single DandiPath entry
+        block_size : int, optional
+            Bytes per HTTP range request when streaming from s3. Larger blocks
+            collapse many small HDF5 metadata reads into fewer round trips.
+            Default 8 MB.
+        rdcc_nbytes : int, optional
+            Size of the HDF5 raw data chunk cache in bytes. Defaults to
+            DandiPath.DEFAULT_RDCC_NBYTES.
+        """
         dandiset_id, dandi_path, dandi_instance = (self & key).fetch1(
             "dandiset_id", "dandi_path", "dandi_instance"
         )
@@ -80,8 +106,13 @@ class DandiPath(SpyglassMixin, dj.Manual):
         )
 
         # Open and return the file
-        fs_file = fsspec_file.open(s3_url, "rb")
-        io = pynwb.NWBHDF5IO(file=h5py.File(fs_file))
+        fs_file = fsspec_file.open(s3_url, "rb", block_size=block_size)
+        h5_file = h5py.File(
+            fs_file,
+            mode="r",
+            rdcc_nbytes=rdcc_nbytes or self.DEFAULT_RDCC_NBYTES,
+        )
+        io = pynwb.NWBHDF5IO(file=h5_file)
         nwbfile = io.read()
         return (io, nwbfile)
 
@@ -108,8 +139,7 @@ class DandiPath(SpyglassMixin, dj.Manual):
         skip_raw_files : bool, optional
             Dev tool to skip raw files in the export. Defaults to False.
         """
-        key = (Export & key).fetch1("KEY")
-        paper_id = (Export & key).fetch1("paper_id")
+        key, paper_id = (Export & key).fetch1("KEY", "paper_id")
         if self & key:
             raise ValueError(
                 "Adding new files to an existing dandiset is not permitted. "
@@ -143,18 +173,32 @@ class DandiPath(SpyglassMixin, dj.Manual):
                 )
 
         os.makedirs(destination_dir, exist_ok=False)
+        # destination_dir is new, so only repeated basenames can collide
+        destinations = {}
         for file in source_files:
-            if os.path.exists(f"{destination_dir}/{os.path.basename(file)}"):
-                continue
             if skip_raw_files and raw_dir in file:
                 continue
+            file_name = os.path.basename(file)
+            if file_name not in destinations:
+                destinations[file_name] = file
+        files_to_add = list(destinations.values())
+
+        # check all files for external links in parallel before linking
+        with ProcessPoolExecutor() as executor:
+            has_external_links = list(
+                executor.map(nwb_has_external_links, files_to_add)
+            )
+
+        for file, needs_copy in zip(files_to_add, has_external_links):
+            destination = f"{destination_dir}/{os.path.basename(file)}"
             # copy the file if it has external links so can be safely edited
-            if nwb_has_external_links(file):
-                shutil.copy(file, f"{destination_dir}/{os.path.basename(file)}")
+            if needs_copy:
+                _link_or_copy(file, destination)
             else:
-                os.symlink(file, f"{destination_dir}/{os.path.basename(file)}")
+                os.symlink(file, destination)
 
-        # validate the dandiset
+        # validate the dandiset before downloading, so a failure leaves no
+        # partial download behind. A running download can't be cancelled
         validate_dandiset(destination_dir, ignore_external_files=True)
 
         # given dandiset_id, download the dandiset to the export_dir
@@ -186,23 +230,25 @@ class DandiPath(SpyglassMixin, dj.Manual):
         )
         logger.info(f"Dandiset {dandiset_id} uploaded")
         # insert the translations into the dandi table
+        file_entries = {
+            os.path.basename(entry["file_path"]): entry
+            for entry in (Export.File() & key).fetch(as_dict=True)
+        }
         translations = [
             {
-                **(
-                    Export.File() & key & f"file_path LIKE '%{t['filename']}'"
-                ).fetch1(),
-                **t,
+                **file_entries[filename],
+                "filename": filename,
+                "dandi_path": dandi_path,
                 "dandiset_id": dandiset_id,
                 "dandi_instance": dandi_instance,
             }
-            for t in translations
+            for filename, dandi_path in translations.items()
         ]
         self.insert(translations, ignore_extra_fields=True)
 
     def write_mysqldump(self, export_key: dict):
         """Write a MySQL dump script to the paper directory for DandiPath."""
-        key = (Export & export_key).fetch1("KEY")
-        paper_id = (Export & key).fetch1("paper_id")
+        key, paper_id = (Export & export_key).fetch1("KEY", "paper_id")
         spyglass_version = (ExportSelection & key).fetch(
             "spyglass_version", limit=1
         )[0]
@@ -220,6 +266,18 @@ class DandiPath(SpyglassMixin, dj.Manual):
         sql_dump.write_mysqldump([self & key], file_suffix="_dandi")
 
 
+def _link_or_copy(source, destination):
+    """Hardlink source to destination, copying if not on the same filesystem.
+
+    Files in the staging directory are not edited in place: dandi.organize
+    copies them into the dandiset before updating external file paths.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy(source, destination)
+
+
 def _get_metadata(path):
     # taken from definition within dandi.organize.organize
     try:
@@ -231,7 +289,7 @@ def _get_metadata(path):
     return meta
 
 
-def translate_name_to_dandi(folder):
+def translate_name_to_dandi(folder, max_workers: int = None):
     """Uses dandi.organize to translate filenames to dandi paths
 
     NOTE: The name for a given file depends on all files in the folder
@@ -240,6 +298,9 @@ def translate_name_to_dandi(folder):
     ----------
     folder : str
         location of files to be translated
+    max_workers : int, optional
+        number of processes used to read file metadata. Defaults to the
+        number of cpus, up to 16.
 
     Returns
     -------
@@ -247,8 +308,10 @@ def translate_name_to_dandi(folder):
         dictionary of filename to dandi_path translations
     """
 
-    files = Path(folder).glob("*")
-    metadata = list(map(_get_metadata, files))
+    files = list(Path(folder).glob("*"))
+    max_workers = max_workers or min(os.cpu_count() or 1, 16)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        metadata = list(executor.map(_get_metadata, files))
     metadata, skip_invalid = dandi.organize.filter_invalid_metadata_rows(
         metadata
     )
@@ -261,7 +324,19 @@ def translate_name_to_dandi(folder):
     ]
 
 
-def lookup_dandi_translation(source_dir: str, dandiset_dir: str):
+def _get_nwb_object_id(path):
+    """Return the object_id of the nwb file at path
+
+    Read from the root group attributes to avoid building the full NWBFile.
+    """
+    with h5py.File(path, "r") as f:
+        object_id = f.attrs["object_id"]
+    return object_id.decode() if isinstance(object_id, bytes) else object_id
+
+
+def lookup_dandi_translation(
+    source_dir: str, dandiset_dir: str, max_workers: int = None
+):
     """Get the dandi_path for each nwb file in the source_dir from
     the organized dandi directory
 
@@ -271,27 +346,34 @@ def lookup_dandi_translation(source_dir: str, dandiset_dir: str):
         location of the source files
     dandiset_dir : str
         location of the organized dandiset directory
+    max_workers : int, optional
+        number of processes used to read nwb files. Defaults to the number of
+        cpus, up to 16.
 
     Returns
     -------
     dict
         dictionary of filename to dandi_path translations
     """
+    dandi_files = list(Path(dandiset_dir).rglob("*.nwb"))
+    source_files = list(Path(source_dir).glob("*"))
+    max_workers = max_workers or min(os.cpu_count() or 1, 16)
+
+    # h5py serializes threads, so read the files in separate processes
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        dandi_ids = list(executor.map(_get_nwb_object_id, dandi_files))
+        source_ids = list(executor.map(_get_nwb_object_id, source_files))
+
     # get the obj_id and dandipath for each nwb file in the dandiset
-    dandi_name_dict = {}
-    for dandi_file in Path(dandiset_dir).rglob("*.nwb"):
-        dandi_path = dandi_file.relative_to(dandiset_dir).as_posix()
-        with pynwb.NWBHDF5IO(dandi_file, "r") as io:
-            nwb = io.read()
-            dandi_name_dict[nwb.object_id] = dandi_path
+    dandi_name_dict = {
+        obj_id: dandi_file.relative_to(dandiset_dir).as_posix()
+        for obj_id, dandi_file in zip(dandi_ids, dandi_files)
+    }
     # for each file in the source_dir, lookup the dandipath based on the obj_id
-    name_translation = {}
-    for file in Path(source_dir).glob("*"):
-        with pynwb.NWBHDF5IO(file, "r") as io:
-            nwb = io.read()
-            dandi_path = dandi_name_dict[nwb.object_id]
-            name_translation[file.name] = dandi_path
-    return name_translation
+    return {
+        file.name: dandi_name_dict[obj_id]
+        for obj_id, file in zip(source_ids, source_files)
+    }
 
 
 def validate_dandiset(
@@ -313,20 +395,18 @@ def validate_dandiset(
     validator_result = dandi.validate.validate(folder)
     min_severity_value = Severity[min_severity].value
 
+    # ignore external file errors if requested. resolved during organize step
     filtered_results = [
         i
         for i in validator_result
-        if i.severity is not None and i.severity.value >= min_severity_value
+        if i.severity is not None
+        and i.severity.value >= min_severity_value
+        and not (
+            ignore_external_files
+            and i.message.startswith(EXTERNAL_FILE_ERROR_PREFIX)
+        )
     ]
 
-    if ignore_external_files:
-        # ignore external file errors. will be resolved during organize step
-        filtered_results = [
-            i
-            for i in filtered_results
-            if not i.message.startswith("Path is not inside")
-        ]
-
     if filtered_results:
         raise ValueError(
             "Validation failed\n\t"
@@ -12,7 +12,8 @@ import numpy as np
 import pandas as pd
 import pynwb
 import spikeinterface as si
-from hdmf.common import DynamicTable
+from hdmf.backends.hdf5 import H5DataIO
+from hdmf.common import DynamicTable, VectorData
 
 from spyglass import __version__ as sg_version
 from spyglass.settings import analysis_dir, raw_dir
@@ -377,6 +378,7 @@ class AnalysisNwbfile(SpyglassMixin, dj.Manual):
         analysis_file_name: str,
         nwb_object: pynwb.core.NWBDataInterface,
         table_name: str = "pandas_table",
+        chunk_bytes: int = None,
     ):
         # TODO: change to add_object with checks for object type and a name
         # parameter, which should be specified if it is not an NWB container
@@ -393,6 +395,10 @@ class AnalysisNwbfile(SpyglassMixin, dj.Manual):
         table_name : str, optional
             The name of the DynamicTable made from a dataframe. Defaults to
             'pandas_table'.
+        chunk_bytes : int, optional
+            If set, numeric columns of a dataframe are written gzip-compressed
+            in chunks of about this many bytes. Defaults to None, using h5py
+            chunking.
 
         Returns
         -------
@@ -405,7 +411,11 @@ class AnalysisNwbfile(SpyglassMixin, dj.Manual):
             load_namespaces=True,
         ) as io:
             nwbf = io.read()
-            if isinstance(nwb_object, pd.DataFrame):
+            if isinstance(nwb_object, pd.DataFrame) and chunk_bytes:
+                nwb_object = self._chunked_table_from_dataframe(
+                    name=table_name, df=nwb_object, chunk_bytes=chunk_bytes
+                )
+            elif isinstance(nwb_object, pd.DataFrame):
                 nwb_object = DynamicTable.from_dataframe(
                     name=table_name, df=nwb_object
                 )
@@ -413,6 +423,38 @@ class AnalysisNwbfile(SpyglassMixin, dj.Manual):
             io.write(nwbf)
             return nwb_object.object_id
 
+    @staticmethod
+    def _chunked_table_from_dataframe(
+        name: str, df: pd.DataFrame, chunk_bytes: int
+    ) -> DynamicTable:
+        """Make a DynamicTable from df with explicitly chunked columns.
+
+        Mirrors DynamicTable.from_dataframe, wrapping numeric columns in
+        H5DataIO so that each chunk holds about chunk_bytes.
+        """
+        columns = []
+        for col_name, col in df.items():
+            data = col.to_numpy()
+            if data.dtype.kind in "biuf" and len(data):
+                chunk_len = max(1, min(len(data), chunk_bytes // data.itemsize))
+                data = H5DataIO(
+                    data=data,
+                    chunks=(chunk_len,),
+                    compression="gzip",
+                    compression_opts=4,
+                )
+            columns.append(
+                VectorData(
+                    name=col_name, description="no description", data=data
+                )
+            )
+        return DynamicTable(
+            name=name,
+            description="",
+            id=df.index.to_numpy(),
+            columns=columns,
+        )
+
     def add_units(
         self,
         analysis_file_name: str,
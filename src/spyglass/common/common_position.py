@@ -8,7 +8,6 @@ import pynwb.behavior
 from position_tools import (
     get_angle,
     get_distance,
-    get_speed,
     get_velocity,
     interpolate_nan,
 )
@@ -296,7 +295,7 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
             .reindex(index=new_time)
         )
 
-        time = np.asarray(position_df.index)
+        time = position_df.index.to_numpy(dtype=np.float64)
         back_LED = np.asarray(position_df.loc[:, ["back_LED_x", "back_LED_y"]])
         front_LED = np.asarray(
             position_df.loc[:, ["front_LED_x", "front_LED_y"]]
@@ -339,7 +338,7 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
 
         spatial_df = _fix_col_names(spatial_df)
         # Get spatial series properties
-        time = np.asarray(spatial_df.index)  # seconds
+        time = spatial_df.index.to_numpy(dtype=np.float64)  # seconds
         position = np.asarray(spatial_df.iloc[:, :4])  # meters
 
         # remove NaN times
@@ -379,19 +378,15 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
         back_LED[is_too_separated] = np.nan
         front_LED[is_too_separated] = np.nan
 
-        # Calculate speed
-        front_LED_speed = get_speed(
-            front_LED,
-            time,
-            sigma=speed_smoothing_std_dev,
-            sampling_frequency=sampling_rate,
-        )
-        back_LED_speed = get_speed(
-            back_LED,
-            time,
+        # Calculate speed, smoothing both LEDs' columns in one pass
+        LED_velocity = get_velocity(
+            np.hstack((front_LED, back_LED)),
+            time=time,
             sigma=speed_smoothing_std_dev,
             sampling_frequency=sampling_rate,
         )
+        front_LED_speed = np.sqrt(np.sum(LED_velocity[:, :2] ** 2, axis=1))
+        back_LED_speed = np.sqrt(np.sum(LED_velocity[:, 2:] ** 2, axis=1))
 
         # Set to points to NaN where the speed is too fast
         is_too_fast = (front_LED_speed > max_plausible_speed) | (
@@ -406,12 +401,13 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
 
         # Smooth
         moving_average_window = int(position_smoothing_duration * sampling_rate)
-        back_LED = bottleneck.move_mean(
-            back_LED, window=moving_average_window, axis=0, min_count=1
-        )
-        front_LED = bottleneck.move_mean(
-            front_LED, window=moving_average_window, axis=0, min_count=1
+        LEDs = bottleneck.move_mean(
+            np.hstack((back_LED, front_LED)),
+            window=moving_average_window,
+            axis=0,
+            min_count=1,
         )
+        back_LED, front_LED = LEDs[:, :2], LEDs[:, 2:]
 
         if is_upsampled:
             front_LED, back_LED, time, sampling_rate = self._upsample(
@@ -463,7 +459,10 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
 
     @staticmethod
     def _data_to_df(
-        data: pd.DataFrame, prefix: str = "head_", add_frame_ind: bool = False
+        data: pd.DataFrame,
+        prefix: str = "head_",
+        add_frame_ind: bool = False,
+        include_velocity: bool = True,
     ):
         pos, ori, vel = [
             prefix + c for c in ["position", "orientation", "velocity"]
@@ -478,23 +477,20 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
             f"{prefix}speed",
         ]
 
-        df = pd.DataFrame(
-            np.concatenate(
-                (
-                    np.asarray(data[pos].get_spatial_series().data),
-                    np.asarray(data[ori].get_spatial_series().data)[
-                        :, np.newaxis
-                    ],
-                    np.asarray(data[vel].time_series[vel].data),
-                ),
-                axis=1,
-            ),
-            columns=COLUMNS,
-            index=pd.Index(
-                np.asarray(data[pos].get_spatial_series().timestamps),
-                name="time",
-            ),
+        index = pd.Index(
+            np.asarray(data[pos].get_spatial_series().timestamps),
+            name="time",
         )
+        if not include_velocity:  # Skip reading velocity data entirely
+            COLUMNS = COLUMNS[:3]
+
+        # Fill one preallocated buffer rather than concatenating copies
+        values = np.empty((len(index), len(COLUMNS)))
+        values[:, 0:2] = data[pos].get_spatial_series().data
+        values[:, 2] = data[ori].get_spatial_series().data
+        if include_velocity:
+            values[:, 3:6] = data[vel].time_series[vel].data
+        df = pd.DataFrame(values, columns=COLUMNS, index=index, copy=False)
 
         if add_frame_ind:
             df.insert(
@@ -587,7 +583,7 @@ class PositionVideo(SpyglassMixin, dj.Computed):
             position_info_df[["head_orientation"]]
         )
         video_time = np.asarray(nwb_video.timestamps)
-        position_time = np.asarray(position_info_df.index)
+        position_time = position_info_df.index.to_numpy(dtype=np.float64)
         cm_per_pixel = nwb_video.device.meters_per_pixel * M_TO_CM
 
         logger.info("Making video...")
@@ -655,15 +651,35 @@ class PositionVideo(SpyglassMixin, dj.Computed):
             output_video_filename, fourcc, frame_rate, frame_size, True
         )
 
-        centroids = {
-            color: fill_nan(data, video_time, position_time)
-            for color, data in centroids.items()
-        }
-        head_position_mean = fill_nan(
-            head_position_mean, video_time, position_time
+        # Resample all variables onto video time in one call, as columns:
+        #   centroids (2 per color), head position (2), head orientation (1)
+        filled = fill_nan(
+            np.column_stack(
+                (*centroids.values(), head_position_mean, head_orientation_mean)
+            ),
+            video_time,
+            position_time,
         )
-        head_orientation_mean = fill_nan(
-            head_orientation_mean, video_time, position_time
+        # Centroids as one (n_time, n_colors, 2) array, indexed by color order
+        colors = list(centroids)
+        centroids_arr = filled[:, :-3].reshape(len(filled), len(colors), 2)
+        has_centroid = ~np.isnan(centroids_arr).any(axis=2)
+        centroid_styles = (
+            (colors.index("red"), RGB_YELLOW),
+            (colors.index("green"), RGB_PINK),
+        )
+        head_position_mean = filled[:, -3:-1]
+        head_orientation_mean = filled[:, -1:]
+
+        # Pixel positions and arrow tips for all frames in one vectorized pass
+        head_position_px = convert_to_pixels(
+            data=head_position_mean, cm_to_pixels=cm_to_pixels
+        )
+        head_orientation = head_orientation_mean.reshape(
+            len(head_orientation_mean), -1
+        )[:, 0]
+        arrow_tips = head_position_px + arrow_radius * np.column_stack(
+            (np.cos(head_orientation), np.sin(head_orientation))
         )
 
         for time_ind in tqdm(
@@ -673,52 +689,27 @@ class PositionVideo(SpyglassMixin, dj.Computed):
             if is_grabbed:
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-                red_centroid = centroids["red"][time_ind]
-                green_centroid = centroids["green"][time_ind]
-
-                head_position = head_position_mean[time_ind]
-                head_position = convert_to_pixels(
-                    data=head_position, cm_to_pixels=cm_to_pixels
-                )
-                head_orientation = head_orientation_mean[time_ind]
-
-                if np.all(~np.isnan(red_centroid)):
-                    cv2.circle(
-                        img=frame,
-                        center=tuple(red_centroid.astype(int)),
-                        radius=circle_radius,
-                        color=RGB_YELLOW,
-                        thickness=-1,
-                        shift=cv2.CV_8U,
-                    )
-
-                if np.all(~np.isnan(green_centroid)):
-                    cv2.circle(
-                        img=frame,
-                        center=tuple(green_centroid.astype(int)),
-                        radius=circle_radius,
-                        color=RGB_PINK,
-                        thickness=-1,
-                        shift=cv2.CV_8U,
-                    )
-
-                if np.all(~np.isnan(head_position)) & np.all(
-                    ~np.isnan(head_orientation)
-                ):
-                    arrow_tip = (
-                        int(
-                            head_position[0]
-                            + arrow_radius * np.cos(head_orientation)
-                        ),
-                        int(
-                            head_position[1]
-                            + arrow_radius * np.sin(head_orientation)
-                        ),
-                    )
+                head_position = head_position_px[time_ind]
+                arrow_tip = arrow_tips[time_ind]
+
+                for color_ind, rgb in centroid_styles:
+                    if has_centroid[time_ind, color_ind]:
+                        cv2.circle(
+                            img=frame,
+                            center=tuple(
+                                centroids_arr[time_ind, color_ind].astype(int)
+                            ),
+                            radius=circle_radius,
+                            color=rgb,
+                            thickness=-1,
+                            shift=cv2.CV_8U,
+                        )
+
+                if np.all(~np.isnan(arrow_tip)):  # NaN if either input is
                     cv2.arrowedLine(
                         img=frame,
                         pt1=tuple(head_position.astype(int)),
-                        pt2=arrow_tip,
+                        pt2=tuple(arrow_tip.astype(int)),
                         color=RGB_WHITE,
                         thickness=4,
                         line_type=8,
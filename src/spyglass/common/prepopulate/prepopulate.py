@@ -2,6 +2,7 @@ import logging
 import os
 import pathlib
 import sys
+from functools import lru_cache
 
 import datajoint as dj
 import yaml
@@ -28,14 +29,17 @@ def populate_from_yaml(yaml_path: str):
 
     for table_name, table_entries in d.items():
         table_cls = _get_table_cls(table_name)
+        if not issubclass(table_cls, (dj.Manual, dj.Lookup, dj.Part)):
+            raise ValueError(
+                f"Prepopulate YAML ('{yaml_path}') contains table "
+                + f"{table_name}' that cannot be prepopulated. Only Manual "
+                + "and Lookup tables can be prepopulated."
+            )
+        primary_key = table_cls.primary_key
+        existing_keys = None  # fetched once per table, on first use
+        new_entries = []
         for entry_dict in table_entries:
             # test whether an entity with the primary key(s) already exists
-            if not issubclass(table_cls, (dj.Manual, dj.Lookup, dj.Part)):
-                raise ValueError(
-                    f"Prepopulate YAML ('{yaml_path}') contains table "
-                    + f"{table_name}' that cannot be prepopulated. Only Manual "
-                    + "and Lookup tables can be prepopulated."
-                )
             if hasattr(table_cls, "fetch_add"):
                 # if the table has defined a fetch_add method, use that instead
                 # of insert1. this is useful for tables where the primary key
@@ -52,9 +56,7 @@ def populate_from_yaml(yaml_path: str):
                 continue
 
             primary_key_values = {
-                k: v
-                for k, v in entry_dict.items()
-                if k in table_cls.primary_key
+                k: v for k, v in entry_dict.items() if k in primary_key
             }
             if not primary_key_values:
                 logger.warning(
@@ -62,34 +64,45 @@ def populate_from_yaml(yaml_path: str):
                     + f"for table {table_cls.__name__}"
                 )
                 continue
-            if primary_key_values not in table_cls.fetch(
-                *table_cls.primary_key, as_dict=True
-            ):
+            if existing_keys is None:
+                existing_keys = {
+                    tuple(row[k] for k in primary_key)
+                    for row in table_cls.fetch(*primary_key, as_dict=True)
+                }
+            key_tuple = tuple(primary_key_values.get(k) for k in primary_key)
+            if key_tuple not in existing_keys:
                 logger.info(
                     f"Populate: Populating table {table_cls.__name__} with data"
-                    + f" {entry_dict} using insert1."
+                    + f" {entry_dict} using insert."
                 )
-                table_cls.insert1(entry_dict)
+                existing_keys.add(key_tuple)
+                new_entries.append(entry_dict)
             else:
                 logging.warn(
                     f"Populate: Entry in {table_cls.__name__} with primary keys"
                     + f" {primary_key_values} already exists."
                 )
+        if new_entries:
+            table_cls.insert(new_entries)
+
+
+def _common_module():
+    """Return the spyglass.common module, importing it if not yet loaded."""
+    module = sys.modules.get("spyglass.common")
+    if module is None:
+        import spyglass.common as module
+    return module
 
 
+@lru_cache(maxsize=None)
 def _get_table_cls(table_name: str):
     """Get the spyglass.common class associated with a given table name.
 
     Also works for part tables one level deep.
     """
 
-    if "." in table_name:  # part table
-        master_table_name = table_name[0 : table_name.index(".")]
-        part_table_name = table_name[table_name.index(".") + 1 :]
-        master_table_cls = getattr(
-            sys.modules["spyglass.common"], master_table_name
-        )
-        part_table_cls = getattr(master_table_cls, part_table_name)
-        return part_table_cls
-    else:
-        return getattr(sys.modules["spyglass.common"], table_name)
+    master_table_name, is_part, part_table_name = table_name.partition(".")
+    master_table_cls = getattr(_common_module(), master_table_name)
+    if is_part:  # part table
+        return getattr(master_table_cls, part_table_name)
+    return master_table_cls
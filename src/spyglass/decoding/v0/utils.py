@@ -60,9 +60,14 @@ def discretize_and_trim(series: xr.DataArray, ndims=1) -> xr.DataArray:
         if ndims == 1
         else ["time", "y_position", "x_position"]
     )
-    discretized = np.multiply(series, 255).astype(np.uint8)  # type: ignore
+    # scale directly into a uint8 buffer to skip the float64 temporary
+    discretized = np.empty(series.shape, dtype=np.uint8)
+    np.multiply(series.values, 255, out=discretized, casting="unsafe")
+    discretized = series.copy(data=discretized)
     stacked = discretized.stack(unified_index=index)
-    return stacked.where(stacked > 0, drop=True).astype(np.uint8)
+    # index the nonzero bins directly; `where(drop=True)` would promote to
+    # float64 to hold NaNs before dropping them
+    return stacked.isel(unified_index=np.flatnonzero(stacked.values))
 
 
 def make_default_decoding_params(clusterless=False, use_gpu=False):
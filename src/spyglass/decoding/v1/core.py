@@ -67,10 +67,13 @@ class DecodingParameters(SpyglassMixin, dj.Lookup):
             row["decoding_params"] = convert_classes_to_dict(params)
         super().insert(rows, *args, **kwargs)
 
-    def fetch(self, *args, **kwargs):
-        """Return decoding parameters as a list of classes."""
+    def fetch(self, *args, restore=True, **kwargs):
+        """Return decoding parameters as a list of classes.
+
+        Set restore=False to skip converting decoding_params back to classes.
+        """
         rows = super().fetch(*args, **kwargs)
-        if kwargs.get("format", None) == "array":
+        if not restore or kwargs.get("format", None) == "array":
             # case when recalled by dj.fetch(), class conversion performed later in stack
             return rows
 
@@ -84,20 +87,25 @@ class DecodingParameters(SpyglassMixin, dj.Lookup):
         params_index = args.index("decoding_params")
         if len(args) == 1:
             # only fetching decoding_params
-            content = [restore_classes(r) for r in rows]
-        elif len(rows):
-            content = []
-            for row in zip(*rows):
-                row = list(row)
-                row[params_index] = restore_classes(row[params_index])
-                content.append(tuple(row))
-        else:
-            content = rows
-        return content
-
-    def fetch1(self, *args, **kwargs):
-        """Return one decoding paramset as a class."""
+            return [restore_classes(r) for r in rows]
+        if not len(rows):
+            return rows
+        return [
+            tuple(
+                restore_classes(value) if i == params_index else value
+                for i, value in enumerate(row)
+            )
+            for row in zip(*rows)
+        ]
+
+    def fetch1(self, *args, restore=True, **kwargs):
+        """Return one decoding paramset as a class.
+
+        Set restore=False to skip converting decoding_params back to classes.
+        """
         row = super().fetch1(*args, **kwargs)
+        if not restore:
+            return row
 
         if len(args) == 0:
             row["decoding_params"] = restore_classes(row["decoding_params"])
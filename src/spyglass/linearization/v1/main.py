@@ -138,12 +138,9 @@ class LinearizedPositionV1(SpyglassMixin, dj.Computed):
         key["analysis_file_name"] = AnalysisNwbfile().create(  # logged
             position_nwb["nwb_file_name"]
         )
-        position = np.asarray(
-            position_nwb["position"].get_spatial_series().data
-        )
-        time = np.asarray(
-            position_nwb["position"].get_spatial_series().timestamps
-        )
+        spatial_series = position_nwb["position"].get_spatial_series()
+        position = np.asarray(spatial_series.data)
+        time = np.asarray(spatial_series.timestamps)
 
         linearization_parameters = (
             LinearizationParameters()
@@ -171,7 +168,8 @@ class LinearizedPositionV1(SpyglassMixin, dj.Computed):
             edge_map=track_graph_info["edge_map"],
         )
 
-        linear_position_df["time"] = time
+        # time stays a column: the DataFrame index becomes the DynamicTable id
+        linear_position_df.insert(0, "time", time)
 
         # Insert into analysis nwb file
         nwb_analysis_file = AnalysisNwbfile()
@@ -179,6 +177,7 @@ class LinearizedPositionV1(SpyglassMixin, dj.Computed):
         key["linearized_position_object_id"] = nwb_analysis_file.add_nwb_object(
             analysis_file_name=key["analysis_file_name"],
             nwb_object=linear_position_df,
+            chunk_bytes=1024 * 1024,
         )
 
         nwb_analysis_file.add(
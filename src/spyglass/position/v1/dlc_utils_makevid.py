@@ -1,9 +1,19 @@
 # Convenience functions
 
 # some DLC-utils copied from datajoint element-interface utils.py
+import multiprocessing
+import queue
 import shutil
 import subprocess
-from concurrent.futures import ProcessPoolExecutor, TimeoutError, as_completed
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
 import matplotlib
@@ -30,6 +40,58 @@ COLOR_SWATCH = [
     "#ffe91a",
 ]
 
+_WORKER_VIDEO_MAKER = None  # Set in process pool workers only, by initializer
+
+
+def _init_worker(video_maker):
+    """Hold one copy of the VideoMaker in each pool worker."""
+    global _WORKER_VIDEO_MAKER
+    _WORKER_VIDEO_MAKER = video_maker
+
+
+def _generate_frame_in_worker(frame_ind, frame=None):
+    """Plot a frame with the worker's VideoMaker, see _init_worker."""
+    return _WORKER_VIDEO_MAKER._generate_single_frame(frame_ind, frame)
+
+
+@lru_cache(maxsize=32)
+def _probe_video(video_filename, mtime=None):
+    """Return video stream properties as (name, value) string pairs.
+
+    Reports width, height, nominal and average frame rate, and frame count
+    via ffprobe. Cached per path and modification time, so repeated
+    VideoMaker calls on one video skip the subprocess.
+    """
+    ret = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v",
+            "-show_entries",
+            "stream=width,height,r_frame_rate,avg_frame_rate,nb_frames",
+            "-of",
+            "default=noprint_wrappers=1",
+            video_filename,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if ret.returncode != 0:
+        raise ValueError(f"Error getting video dimensions: {ret.stderr}")
+    return tuple(
+        tuple(line.split("=", 1)) for line in ret.stdout.strip().splitlines()
+    )
+
+
+def _parse_rate(rate):
+    """Convert an ffprobe rate like '30000/1001' to float. NaN if unknown."""
+    num, _, den = rate.partition("/")
+    den = float(den or 1)
+    return float(num) / den if den else np.nan
+
 
 class VideoMaker:
     def __init__(
@@ -59,9 +121,9 @@ class VideoMaker:
         """Create a video from a set of position data.
 
         Uses batch size as frame count for processing steps. All in temp_dir.
-            1. Extract frames from original video to 'orig_XXXX.png'
-            2. Multithread pool frames to matplotlib 'plot_XXXX.png'
-            3. Stitch frames into partial video 'partial_XXXX.mp4'
+            1. Stream decoded frames from original video via an ffmpeg pipe
+            2. Multiprocess pool frames through matplotlib to raw RGBA
+            3. Pipe rendered frames to ffmpeg as 'partial_XXXX.mp4'
             4. Concatenate partial videos into final video output
 
         """
@@ -99,7 +161,8 @@ class VideoMaker:
         self.crop = crop
         self.window_ind = np.arange(501) - 501 // 2
         self.debug = debug
-        self.start_time = pd.to_datetime(position_time[0] * 1e9, unit="ns")
+        # Seconds since first position sample, for frame titles
+        self.time_delta = np.asarray(position_time) - float(position_time[0])
 
         self.dropped_frames = set()
 
@@ -107,14 +170,19 @@ class VideoMaker:
         self.max_workers = max_workers
         self.max_jobs_in_queue = max_jobs_in_queue
         self.timeout = 30 if test_mode else 300
+        self.prefetch_frames = 32  # Decoded frames to read ahead
 
+        self.dpi = 100
         self.ffmpeg_log_args = ["-hide_banner", "-loglevel", "error"]
         self.ffmpeg_fmt_args = ["-c:v", "libx264", "-pix_fmt", "yuv420p"]
+        # yuv420p needs even dimensions, pad the canvas if it is ever odd
+        self.ffmpeg_pad_args = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
 
         prev_backend = matplotlib.get_backend()
         matplotlib.use("Agg")  # Use non-interactive backend
 
         _ = self._set_frame_info()
+        _ = self._set_pixel_data()
         _ = self._set_plot_bases()
 
         logger.info(
@@ -131,33 +199,26 @@ class VideoMaker:
 
         matplotlib.use(prev_backend)  # Reset to previous backend
 
+    def __getstate__(self):
+        """Exclude the decoding process and its reader when pickling."""
+        state = self.__dict__.copy()
+        for attr in ("_frame_reader", "_frame_queue", "_frame_prefetch"):
+            state.pop(attr, None)
+        state["_background"] = None  # Canvas regions are captured per process
+        return state
+
     def _set_frame_info(self):
         """Set the frame information for the video."""
         logger.debug("Setting frame information")
 
-        ret = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "v",
-                "-show_entries",
-                "stream=width,height,r_frame_rate,nb_frames",
-                "-of",
-                "csv=p=0:s=x",
-                str(self.video_filename),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        video_path = Path(self.video_filename)
+        stats = dict(_probe_video(str(video_path), video_path.stat().st_mtime))
+        self.width, self.height = int(stats["width"]), int(stats["height"])
+        self.frame_rate = _parse_rate(stats["r_frame_rate"])
+        # Seeking by timestamp assumes frames are evenly spaced in time
+        self.constant_frame_rate = np.isclose(
+            self.frame_rate, _parse_rate(stats["avg_frame_rate"]), rtol=1e-3
         )
-        if ret.returncode != 0:
-            raise ValueError(f"Error getting video dimensions: {ret.stderr}")
-
-        stats = ret.stdout.strip().split("x")
-        self.width, self.height = tuple(map(int, stats[:2]))
-        self.frame_rate = eval(stats[2])
 
         self.frame_size = (
             (self.width, self.height)
@@ -182,21 +243,66 @@ class VideoMaker:
         elif self.frames is not None:
             self.n_frames = len(self.frames)
         else:
-            self.n_frames = int(stats[3])
+            self.n_frames = int(stats["nb_frames"])
 
         if self.debug:  # If debugging, limit frames to available data
             self.n_frames = min(len(self.position_mean), self.n_frames)
 
         self.pad_len = len(str(self.n_frames))
 
+        # Map video frame index to first matching position index
+        frame_inds = (
+            [] if self.video_frame_inds is None else self.video_frame_inds
+        )
+        self.frame_to_pos = {}
+        for pos_ind, frame_ind in enumerate(frame_inds):
+            self.frame_to_pos.setdefault(int(frame_ind), pos_ind)
+
+    def _set_pixel_data(self):
+        """Convert all position data to pixels once, ahead of plotting."""
+        logger.debug("Setting pixel data")
+        self.position_px = _to_px(
+            data=np.asarray(self.position_mean), cm_to_pixels=self.cm_to_pixels
+        )
+        # Bodyparts stacked as (n_bodyparts, n_time, 2), in centroids order
+        self.centroids_px = _to_px(
+            data=np.stack([np.asarray(c) for c in self.centroids.values()]),
+            cm_to_pixels=self.cm_to_pixels,
+        )
+        if self.crop:  # Shift into cropped frame: crop is (x0, x1, y0, y1)
+            crop_offset = (self.crop[0], self.crop[2])
+            self.position_px = self.position_px - crop_offset
+            self.centroids_px = self.centroids_px - crop_offset
+        # Trodes passes orientation as a column vector, DLC as a 1D array
+        orient = np.asarray(self.orientation_mean).reshape(
+            len(self.orientation_mean), -1
+        )[:, 0]
+        self.orient_offsets = 30 * np.column_stack(
+            (np.cos(orient), np.sin(orient))
+        )
+        # Likelihoods as one (n_bodyparts, n_time) array for window gathers
+        self.window_time = self.window_ind / self.frame_rate
+        self.likelihoods_arr = (
+            np.vstack([np.asarray(v) for v in self.likelihoods.values()])
+            if self.likelihoods
+            else None
+        )
+
     def _set_plot_bases(self):
         """Create the figure and axes for the video."""
         logger.debug("Setting plot bases")
+        # Render at the video's own resolution, rounded up to even pixel
+        # counts for yuv420p, rather than rendering large and downscaling.
+        # Matplotlib truncates size * dpi, so add half a pixel of margin
+        self.fig_size = tuple(
+            (px + px % 2 + 0.5) / self.dpi for px in self.frame_size
+        )
         plt.style.use("dark_background")
         fig, axes = plt.subplots(
             2,
             1,
-            figsize=(8, 6),
+            figsize=self.fig_size,
+            dpi=self.dpi,
             gridspec_kw={"height_ratios": [8, 1]},
             constrained_layout=False,
         )
@@ -246,12 +352,18 @@ class VideoMaker:
         axes[0].spines["top"].set_color("black")
         axes[0].spines["right"].set_color("black")
 
+        # Single image artist, updated in place for each frame
+        frame_width, frame_height = self.frame_size
+        self.frame_image = axes[0].imshow(
+            np.zeros((frame_height, frame_width, 3), dtype=np.uint8)
+        )
+
         time_delta = pd.Timedelta(
             self.position_time[0] - self.position_time[-1]
         ).total_seconds()
 
         # TODO: Update legend location based on centroid position
-        axes[0].legend(loc="lower right", fontsize=4)
+        legend = axes[0].legend(loc="lower right", fontsize=4)
         self.title = axes[0].set_title(
             f"time = {time_delta:3.4f}s\n frame = {0}",
             fontsize=8,
@@ -286,103 +398,104 @@ class VideoMaker:
             axes[1].spines["right"].set_color("black")
             axes[1].legend(loc="upper right", fontsize=4)
 
+        # Artists redrawn per frame, in draw order, over a cached background
+        self.animated_artists = [
+            self.frame_image,
+            legend,
+            self.orientation_line,
+            *self.centroid_plot_objs.values(),
+            self.centroid_position_dot,
+            self.title,
+            *(self.likelihood_objs.values() if self.likelihoods else []),
+        ]
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        self._background = None
+
         self.fig = fig
         self.axes = axes
 
     def _get_centroid_data(self, pos_ind):
-        def centroid_to_px(*idx):
-            return _to_px(
-                data=self.position_mean[idx], cm_to_pixels=self.cm_to_pixels
-            )
-
-        if not self.crop:
-            return centroid_to_px(pos_ind)
-        return np.hstack(
-            (
-                centroid_to_px((pos_ind, 0, np.newaxis)) - self.crop_offset_x,
-                centroid_to_px((pos_ind, 1, np.newaxis)) - self.crop_offset_y,
-            )
-        )
+        return self.position_px[pos_ind]
 
     def _get_orient_line(self, pos_ind):
-        orient = self.orientation_mean[pos_ind]
-        if isinstance(orient, np.ndarray):
-            orient = orient[0]  # Trodes passes orientation as a 1D array
-
-        def orient_list(c, axis="x"):
-            func = np.cos if axis == "x" else np.sin
-            return [c, c + 30 * func(orient)]
-
-        if np.all(np.isnan(orient)):
+        dx, dy = self.orient_offsets[pos_ind]
+        if np.isnan(dx):
             return ([np.NaN], [np.NaN])
-        else:
-            x, y = self._get_centroid_data(pos_ind)
-            return (orient_list(x), orient_list(y, axis="y"))
-
-    def _generate_single_frame(self, frame_ind):
-        """Generate a single frame and save it as an image."""
-        # Zero-padded filename based on the dynamic padding length
-        padded = self._pad(frame_ind)
-        frame_out_path = self.temp_dir / f"plot_{padded}.png"
-        if frame_out_path.exists() and not self.debug:
-            return frame_ind  # Skip if frame already exists
-
-        frame_file = self.temp_dir / f"orig_{padded}.png"
-        if not frame_file.exists():  # Skip if input frame not found
+        x, y = self._get_centroid_data(pos_ind)
+        return ([x, x + dx], [y, y + dy])
+
+    def _generate_single_frame(self, frame_ind, frame=None):
+        """Generate a single frame as raw RGBA bytes.
+
+        Parameters
+        ----------
+        frame_ind : int
+            Index of the frame in the original video.
+        frame : np.ndarray, optional
+            Decoded RGB frame, shape (height, width, 3). None if the frame
+            could not be decoded.
+
+        Returns
+        -------
+        tuple
+            Frame index and rendered RGBA bytes, None if the frame was
+            dropped.
+        """
+        if frame is None:  # Skip if input frame not decoded
             self.dropped_frames.add(frame_ind)
-            self._debug_print(f"Frame not found: {frame_file}", end="")
-            return
+            if self.debug:
+                self._debug_print(f"Frame not decoded: {self._pad(frame_ind)}")
+            return frame_ind, None
 
-        frame = plt.imread(frame_file)
-        _ = self.axes[0].imshow(frame)
+        self.frame_image.set_data(frame)
 
-        pos_ind = np.where(self.video_frame_inds == frame_ind)[0]
+        pos_ind = self.frame_to_pos.get(frame_ind)
 
-        if len(pos_ind) == 0:
+        if pos_ind is None:
             self.centroid_position_dot.set_offsets((np.NaN, np.NaN))
             for bodypart in self.centroid_plot_objs.keys():
                 self.centroid_plot_objs[bodypart].set_offsets((np.NaN, np.NaN))
             self.orientation_line.set_data((np.NaN, np.NaN))
             self.title.set_text(f"time = {0:3.4f}s\n frame = {frame_ind}")
 
-            self.fig.savefig(frame_out_path, dpi=400)
-            plt.cla()  # clear the current axes
-            return frame_ind
-
-        pos_ind = pos_ind[0]
-        likelihood_inds = pos_ind + self.window_ind
-        neg_inds = np.where(likelihood_inds < 0)[0]
-        likelihood_inds[neg_inds] = 0 if len(neg_inds) > 0 else -1
+            return frame_ind, self._render_frame()
 
         dlc_centroid_data = self._get_centroid_data(pos_ind)
 
-        for bodypart in self.centroid_plot_objs:
-            self.centroid_plot_objs[bodypart].set_offsets(
-                _to_px(
-                    data=self.centroids[bodypart][pos_ind],
-                    cm_to_pixels=self.cm_to_pixels,
-                )
-            )
+        for plot_obj, centroid in zip(
+            self.centroid_plot_objs.values(), self.centroids_px[:, pos_ind]
+        ):
+            plot_obj.set_offsets(centroid)
         self.centroid_position_dot.set_offsets(dlc_centroid_data)
         self.orientation_line.set_data(self._get_orient_line(pos_ind))
 
-        time_delta = pd.Timedelta(
-            pd.to_datetime(self.position_time[pos_ind] * 1e9, unit="ns")
-            - self.start_time
-        ).total_seconds()
-
+        time_delta = self.time_delta[pos_ind]
         self.title.set_text(f"time = {time_delta:3.4f}s\n frame = {frame_ind}")
         if self.likelihoods:
-            for bodypart in self.likelihood_objs.keys():
-                self.likelihood_objs[bodypart].set_data(
-                    self.window_ind / self.frame_rate,
-                    np.asarray(self.likelihoods[bodypart][likelihood_inds]),
-                )
+            likelihood_inds = np.maximum(pos_ind + self.window_ind, 0)
+            window = self.likelihoods_arr[:, likelihood_inds]
+            for likelihood_obj, values in zip(
+                self.likelihood_objs.values(), window
+            ):
+                likelihood_obj.set_data(self.window_time, values)
+
+        return frame_ind, self._render_frame()
 
-        self.fig.savefig(frame_out_path, dpi=400)
-        plt.cla()  # clear the current axes
+    def _render_frame(self):
+        """Draw the current frame and return the figure's RGBA pixel buffer.
 
-        return frame_ind
+        Static parts of the figure are rasterized once and restored for each
+        frame, so only the animated artists are drawn per frame.
+        """
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()  # Animated artists are skipped in a full draw
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        canvas.restore_region(self._background)
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+        return bytes(canvas.buffer_rgba())
 
     def process_frames(self):
         """Process video frames in batches and generate matplotlib frames."""
@@ -390,103 +503,304 @@ class VideoMaker:
         progress_bar = tqdm(leave=True, position=0, disable=self.debug)
         progress_bar.reset(total=self.n_frames)
 
-        for start_frame in range(0, self.n_frames, self.batch_size):
-            if start_frame >= self.n_frames:  # Skip if no frames left
-                break
-            end_frame = min(start_frame + self.batch_size, self.n_frames) - 1
-            logger.debug(f"Processing frames: {start_frame} - {end_frame}")
-
-            output_partial_video = (
-                self.temp_dir / f"partial_{self._pad(start_frame)}.mp4"
-            )
-            if output_partial_video.exists():
-                logger.debug(f"Skipping existing video: {output_partial_video}")
-                progress_bar.update(end_frame - start_frame)
-                continue
+        batch_starts = range(0, self.n_frames, self.batch_size)
+        # On resume, seek the decoder past leading batches already on disk
+        resume_frame = next(
+            (s for s in batch_starts if not self._partial_path(s).exists()),
+            self.n_frames,
+        )
+        # Workers first, so they fork without the decoder pipe or thread
+        executor = self._make_executor()
+        self.partial_videos = []  # In order, for concat_partial_videos
+
+        try:  # Release the decoder, thread and workers on any error
+            self._open_frame_reader(start_frame=resume_frame)
+            try:
+                for start_frame in batch_starts:
+                    self._process_batch(
+                        start_frame, resume_frame, progress_bar, executor
+                    )
+            finally:
+                self._close_frame_reader()
+        finally:
+            executor.shutdown(cancel_futures=True)
+            progress_bar.close()
 
-            self.ffmpeg_extract(start_frame, end_frame)
-            self.plot_frames(start_frame, end_frame, progress_bar)
-            self.ffmpeg_stitch_partial(start_frame, str(output_partial_video))
+        logger.info("Concatenating partial videos")
+        self.concat_partial_videos()
 
-            for frame_file in self.temp_dir.glob("*.png"):
-                frame_file.unlink()  # Delete orig and plot frames
+    def _process_batch(self, start_frame, resume_frame, progress_bar, executor):
+        """Encode one batch to a partial video, unless already on disk."""
+        end_frame = min(start_frame + self.batch_size, self.n_frames) - 1
+        logger.debug(f"Processing frames: {start_frame} - {end_frame}")
+
+        output_partial_video = self._partial_path(start_frame)
+        self.partial_videos.append(output_partial_video)
+        if output_partial_video.exists():
+            logger.debug(f"Skipping existing video: {output_partial_video}")
+            if start_frame > resume_frame:
+                for _ in range(start_frame, end_frame + 1):
+                    _ = self._read_frame()  # Advance decoder past batch
+            progress_bar.update(end_frame - start_frame + 1)
+            return
 
-        progress_bar.close()
+        frame_writer = self._open_frame_writer(str(output_partial_video))
+        try:
+            self.plot_frames(
+                start_frame, end_frame, progress_bar, executor, frame_writer
+            )
+        except BaseException:
+            # Don't leave a truncated partial video to be reused on resume
+            self._abort_frame_writer(frame_writer, output_partial_video)
+            raise
+        self._close_frame_writer(frame_writer)
 
-        logger.info("Concatenating partial videos")
-        self.concat_partial_videos()
+    def _partial_path(self, start_frame):
+        """Path of the partial video for the batch starting at start_frame."""
+        return self.temp_dir / f"partial_{self._pad(start_frame)}.mp4"
 
     def _debug_print(self, msg="             ", end=""):
         """Print a self-overwiting message if debug is enabled."""
         if self.debug:
             print(f"\r{msg}", end=end)
 
-    def plot_frames(self, start_frame, end_frame, progress_bar=None):
+    def _make_executor(self, mp_context=None):
+        """Create a process pool that receives this object once per worker.
+
+        Submitting a bound method would pickle the full object, including
+        the position arrays and figure, for every frame. With a single
+        worker, a thread renders in-process with this object directly:
+        nothing is pickled or held in the module global, and decoding and
+        encoding, which release the GIL, still overlap with rendering.
+        Matplotlib figures are not thread-safe, so more workers always use
+        processes.
+
+        The pool is started before returning. Forked workers inherit every
+        open file descriptor, and a worker holding the encoder's stdin
+        would keep it from seeing EOF, so create the pool before opening
+        any ffmpeg pipe, or pass a spawn or forkserver mp_context.
+        """
+        if self.max_workers == 1:
+            return ThreadPoolExecutor(max_workers=1)
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+        executor.submit(int).result()  # Forking pools start all workers
+        return executor
+
+    def plot_frames(
+        self,
+        start_frame,
+        end_frame,
+        progress_bar=None,
+        executor=None,
+        frame_writer=None,
+    ):
+        """Plot frames in a pool, keeping up to max_jobs_in_queue in flight.
+
+        Rendered frames are written to frame_writer's stdin in frame order.
+        """
         logger.debug(f"Plotting   frames: {start_frame} - {end_frame}")
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            jobs = {}  # dict of jobs
-
-            frames_left = end_frame - start_frame
-            frames_iter = iter(range(start_frame, end_frame))
-
-            while frames_left:
-                while len(jobs) < self.max_jobs_in_queue:
-                    try:
-                        this_frame = next(frames_iter)
-                        self._debug_print(f"Submit: {self._pad(this_frame)}")
-                        job = executor.submit(
-                            self._generate_single_frame, this_frame
-                        )
-                        jobs[job] = this_frame
-                    except StopIteration:
-                        break  # No more frames to submit
-
-                for job in as_completed(jobs):
-                    frames_left -= 1
-                    try:
-                        ret = job.result(timeout=self.timeout)
-                    except (IndexError, TimeoutError) as e:
-                        ret = type(e).__name__
-                    self._debug_print(f"Finish: {self._pad(ret)}")
-                    progress_bar.update()
-                    del jobs[job]
-        self._debug_print(msg="", end="\n")
+        if executor is None:  # Pipes are already open, so don't fork
+            spawn = multiprocessing.get_context("spawn")
+            with self._make_executor(mp_context=spawn) as executor:
+                return self.plot_frames(
+                    start_frame, end_frame, progress_bar, executor, frame_writer
+                )
 
-    def ffmpeg_extract(self, start_frame, end_frame):
-        """Use ffmpeg to extract a batch of frames."""
-        logger.debug(f"Extracting frames: {start_frame} - {end_frame}")
-        last_frame = self.temp_dir / f"orig_{self._pad(end_frame)}.png"
-        if last_frame.exists():  # assumes all frames previously extracted
-            logger.debug(f"Skipping existing frames: {last_frame}")
-            return
+        # end_frame is inclusive, every decoded frame must be consumed
+        frames_iter = iter(range(start_frame, end_frame + 1))
+        jobs = {}  # job: frame index
+        rendered = {}  # frame index: RGBA bytes, held until next in order
+        next_write = start_frame
+        debug = self.debug  # Skip per-frame message formatting if not debug
+        render = (  # Threads share this object, processes hold their own
+            self._generate_single_frame
+            if isinstance(executor, ThreadPoolExecutor)
+            else _generate_frame_in_worker
+        )
 
-        output_pattern = str(self.temp_dir / f"orig_%0{self.pad_len}d.png")
+        def submit_next():
+            this_frame = next(frames_iter, None)
+            if this_frame is None:
+                return
+            if debug:
+                self._debug_print(f"Submit: {self._pad(this_frame)}")
+            job = executor.submit(render, this_frame, self._read_frame())
+            jobs[job] = this_frame
+
+        def finish(frame_ind, frame_bytes, msg=None):
+            nonlocal next_write
+            if debug:
+                self._debug_print(f"Finish: {msg or self._pad(frame_ind)}")
+            progress_bar.update()
+            rendered[frame_ind] = frame_bytes
+            while next_write in rendered:
+                frame_bytes = rendered.pop(next_write)
+                if frame_bytes is not None and frame_writer is not None:
+                    frame_writer.stdin.write(frame_bytes)
+                next_write += 1
+            submit_next()
+
+        for _ in range(self.max_jobs_in_queue):
+            submit_next()
+
+        while jobs:
+            done, _ = wait(
+                jobs, timeout=self.timeout, return_when=FIRST_COMPLETED
+            )
+            if not done:  # No job finished in time, stop waiting on them
+                stalled = sorted(jobs.items(), key=lambda item: item[1])
+                jobs.clear()
+                for job, frame_ind in stalled:
+                    job.cancel()
+                    self.dropped_frames.add(frame_ind)
+                    finish(frame_ind, None, msg="TimeoutError")
+                continue
+            for job in done:
+                frame_ind = jobs.pop(job)
+                try:
+                    _, frame_bytes = job.result()
+                except IndexError as e:
+                    self.dropped_frames.add(frame_ind)
+                    finish(frame_ind, None, msg=type(e).__name__)
+                    continue
+                finish(frame_ind, frame_bytes)
+        self._debug_print(msg="", end="\n")
 
-        # Use ffmpeg to extract frames
+    def _open_frame_writer(self, output_partial_video):
+        """Start an ffmpeg process that encodes raw RGBA frames from stdin."""
+        logger.debug(f"Open part vid    : {output_partial_video}")
+        width, height = self.fig.canvas.get_width_height()
         ffmpeg_cmd = [
             "ffmpeg",
-            "-n",  # no overwrite
+            "-y",  # overwrite
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(self.fps),
             "-i",
-            self.video_filename,
-            "-vf",
-            f"select=between(n\\,{start_frame}\\,{end_frame})",
-            "-vsync",
-            "vfr",
-            "-start_number",
-            str(start_frame),
-            output_pattern,
+            "pipe:",
+            *self.ffmpeg_pad_args,
+            *self.ffmpeg_fmt_args,
+            output_partial_video,
             *self.ffmpeg_log_args,
         ]
-        ret = subprocess.run(ffmpeg_cmd, stderr=subprocess.PIPE)
+        return subprocess.Popen(
+            ffmpeg_cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
 
-        extracted = len(list(self.temp_dir.glob("orig_*.png")))
-        logger.debug(f"Extracted  frames: {start_frame}, len: {extracted}")
-        if extracted < self.batch_size - 1:
-            logger.warning(
-                f"Could not extract frames: {extracted} / {self.batch_size-1}"
+    def _close_frame_writer(self, frame_writer):
+        """Finish encoding a partial video."""
+        frame_writer.stdin.close()
+        stderr = frame_writer.stderr.read()
+        if frame_writer.wait() != 0:
+            logger.error(f"Error stitching partial video: {stderr.decode()}")
+
+    def _abort_frame_writer(self, frame_writer, output_partial_video):
+        """Stop encoding a partial video and remove the incomplete file."""
+        frame_writer.kill()
+        with suppress(BrokenPipeError):  # Unflushed frames have nowhere to go
+            frame_writer.stdin.close()
+        frame_writer.stderr.close()
+        frame_writer.wait()
+        output_partial_video.unlink(missing_ok=True)
+
+    def _open_frame_reader(self, start_frame=0):
+        """Start an ffmpeg process that decodes the video to raw RGB frames.
+
+        Frames are read from the pipe in order, avoiding per-batch decoder
+        startup and an encode/decode round trip through image files.
+
+        Parameters
+        ----------
+        start_frame : int, optional
+            First frame to decode. Nonzero values seek the input once,
+            rather than decoding and discarding all earlier frames. For
+            variable frame rate video, where a frame's timestamp does not
+            follow from its index, earlier frames are discarded instead.
+        """
+        logger.debug(f"Opening frame reader at frame {start_frame}")
+        seek = start_frame and self.constant_frame_rate
+        seek_args = (
+            ["-ss", f"{start_frame / self.frame_rate:.6f}"] if seek else []
+        )
+        frame_width, frame_height = self.frame_size
+        crop_args = []
+        if self.crop:  # Crop while decoding: crop is (x0, x1, y0, y1)
+            crop_filter = f"crop={frame_width}:{frame_height}"
+            crop_args = ["-vf", f"{crop_filter}:{self.crop[0]}:{self.crop[2]}"]
+        ffmpeg_cmd = [
+            "ffmpeg",
+            *seek_args,
+            "-i",
+            str(self.video_filename),
+            *crop_args,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-vsync",
+            "passthrough",
+            "pipe:",
+            *self.ffmpeg_log_args,
+        ]
+        self._frame_reader = subprocess.Popen(
+            ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        self._frame_nbytes = frame_width * frame_height * 3
+
+        # Read ahead in a thread, so decoding continues while frames are
+        # rendered and encoded. Bounded to limit memory held by raw frames.
+        self._frame_queue = queue.Queue(maxsize=self.prefetch_frames)
+        self._frames_ended = False
+        self._frame_prefetch = threading.Thread(
+            target=self._prefetch_frames, daemon=True
+        )
+        self._frame_prefetch.start()
+        if not seek:
+            for _ in range(start_frame):
+                _ = self._read_frame()  # Advance decoder to start_frame
+
+    def _prefetch_frames(self):
+        """Queue decoded frames until the video ends, then queue None."""
+        while True:
+            buffer = self._frame_reader.stdout.read(self._frame_nbytes)
+            if len(buffer) < self._frame_nbytes:
+                self._frame_queue.put(None)
+                return
+            self._frame_queue.put(
+                np.frombuffer(buffer, dtype=np.uint8).reshape(
+                    self.frame_size[1], self.frame_size[0], 3
+                )
             )
-            one_err = "\n".join(str(ret.stderr).split("\\")[-3:-1])
-            logger.debug(f"\nExtract Error: {one_err}")
+
+    def _read_frame(self):
+        """Return the next decoded frame. None if the video has ended."""
+        if self._frames_ended:
+            return None
+        frame = self._frame_queue.get()
+        self._frames_ended = frame is None
+        return frame
+
+    def _close_frame_reader(self):
+        """Stop the decoding process and its read-ahead thread."""
+        self._frame_reader.terminate()
+        while self._frame_prefetch.is_alive():  # Unblock a pending put
+            try:
+                self._frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._frame_prefetch.join()
+        self._frame_reader.stdout.close()
+        self._frame_reader.wait()
 
     def _pad(self, frame_ind=None):
         """Pad a frame index with leading zeros."""
@@ -496,39 +810,9 @@ class VideoMaker:
             return frame_ind
         return f"{frame_ind:0{self.pad_len}d}"
 
-    def ffmpeg_stitch_partial(self, start_frame, output_partial_video):
-        """Stitch a partial movie from processed frames."""
-        logger.debug(f"Stitch part vid  : {start_frame}")
-        frame_pattern = str(self.temp_dir / f"plot_%0{self.pad_len}d.png")
-
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-y",  # overwrite
-            "-r",
-            str(self.fps),
-            "-start_number",
-            str(start_frame),
-            "-i",
-            frame_pattern,
-            *self.ffmpeg_fmt_args,
-            output_partial_video,
-            *self.ffmpeg_log_args,
-        ]
-        try:
-            ret = subprocess.run(
-                ffmpeg_cmd,
-                stderr=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                check=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error stitching partial video: {e.stderr}")
-            logger.debug(f"stderr: {ret.stderr}")
-
     def concat_partial_videos(self):
         """Concatenate all the partial videos into one final video."""
-        partial_vids = sorted(self.temp_dir.glob("partial_*.mp4"))
+        partial_vids = self.partial_videos
         logger.debug(f"Concat part vids: {len(partial_vids)}")
         concat_list_path = self.temp_dir / "concat_list.txt"
         with open(concat_list_path, "w") as f:
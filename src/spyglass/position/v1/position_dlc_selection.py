@@ -154,8 +154,14 @@ class DLCPosV1(SpyglassMixin, dj.Computed):
         )
         AnalysisNwbfile().log(key, table=self.full_table_name)
 
-    def fetch1_dataframe(self) -> pd.DataFrame:
-        """Return the position data as a DataFrame."""
+    def fetch1_dataframe(self, include_velocity=True) -> pd.DataFrame:
+        """Return the position data as a DataFrame.
+
+        Parameters
+        ----------
+        include_velocity : bool, optional
+            Include velocity_x, velocity_y and speed columns. Default True.
+        """
         nwb_data = self.fetch_nwb()[0]
         index = pd.Index(
             np.asarray(nwb_data["position"].get_spatial_series().timestamps),
@@ -170,28 +176,20 @@ class DLCPosV1(SpyglassMixin, dj.Computed):
             "velocity_y",
             "speed",
         ]
-        return pd.DataFrame(
-            np.concatenate(
-                (
-                    np.asarray(
-                        nwb_data["velocity"]
-                        .time_series["video_frame_ind"]
-                        .data,
-                        dtype=int,
-                    )[:, np.newaxis],
-                    np.asarray(nwb_data["position"].get_spatial_series().data),
-                    np.asarray(
-                        nwb_data["orientation"].get_spatial_series().data
-                    )[:, np.newaxis],
-                    np.asarray(
-                        nwb_data["velocity"].time_series["velocity"].data
-                    ),
-                ),
-                axis=1,
-            ),
-            columns=COLUMNS,
-            index=index,
+        if not include_velocity:  # Skip reading velocity data entirely
+            COLUMNS = COLUMNS[:4]
+
+        # Fill one preallocated buffer rather than concatenating copies
+        data = np.empty((len(index), len(COLUMNS)))
+        data[:, 0] = np.asarray(
+            nwb_data["velocity"].time_series["video_frame_ind"].data,
+            dtype=int,
         )
+        data[:, 1:3] = nwb_data["position"].get_spatial_series().data
+        data[:, 3] = nwb_data["orientation"].get_spatial_series().data
+        if include_velocity:
+            data[:, 4:7] = nwb_data["velocity"].time_series["velocity"].data
+        return pd.DataFrame(data, columns=COLUMNS, index=index, copy=False)
 
     def fetch_nwb(self, **kwargs):
         """Fetch the NWB file."""
@@ -363,7 +361,7 @@ class DLCPosVideo(SpyglassMixin, dj.Computed):
         v1_key = {k: v for k, v in key.items() if k in DLCPosV1.primary_key}
         pos_info_df = (
             DLCPosV1() & {"epoch": epoch, **v1_key}
-        ).fetch1_dataframe()
+        ).fetch1_dataframe(include_velocity=False)
         pos_est_df = pd.concat(
             {
                 bodypart: (
@@ -414,7 +412,7 @@ class DLCPosVideo(SpyglassMixin, dj.Computed):
         if limit := params.get("limit", None):  # new int param for debugging
             output_video_filename = Path(".") / f"TEST_VID_{limit}.mp4"
             video_frame_inds = video_frame_inds[:limit]
-            pos_info_df = pos_info_df.head(limit)
+            pos_info_df = pos_info_df.iloc[:limit]
 
         video_maker = make_video(
             video_filename=video_filename,
@@ -425,7 +423,7 @@ class DLCPosVideo(SpyglassMixin, dj.Computed):
             orientation_mean={"DLC": np.asarray(pos_info_df[["orientation"]])},
             centroids=centroids,
             likelihoods=likelihoods,
-            position_time=np.asarray(pos_info_df.index),
+            position_time=pos_info_df.index.to_numpy(dtype=np.float64),
             processor=params.get("processor", "matplotlib"),
             frames=np.arange(frames[0], frames[1]) if frames else None,
             percent_frames=params.get("percent_frames", None),
@@ -1,5 +1,7 @@
 import copy
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import datajoint as dj
@@ -18,6 +20,8 @@ from spyglass.utils.position import fill_nan
 
 schema = dj.schema("position_v1_trodes_position")
 
+_PARAMS_CACHE_SCOPES = 0  # Open populate calls that cache params fetches
+
 
 @schema
 class TrodesPosParams(SpyglassMixin, dj.Manual):
@@ -76,6 +80,41 @@ class TrodesPosParams(SpyglassMixin, dj.Manual):
         """Return a list of accepted parameters for position calculation"""
         return [k for k in cls().default_params.keys()]
 
+    @classmethod
+    def fetch_params(cls, name: str) -> dict:
+        """Return a copy of the params for a paramset name.
+
+        Within a cached_params block, fetches are cached by name, avoiding
+        a query per populated key. Otherwise, params are fetched directly.
+        """
+        if not _PARAMS_CACHE_SCOPES:
+            return (cls & {"trodes_pos_params_name": name}).fetch1("params")
+        return copy.deepcopy(_fetch_trodes_pos_params(name))
+
+    @classmethod
+    @contextmanager
+    def cached_params(cls):
+        """Cache fetch_params by name for the duration of the block.
+
+        Used to scope the cache to a single populate call. The cache is
+        emptied when the outermost block exits, so edits made by other
+        sessions or cascading deletes are seen by the next populate.
+        """
+        global _PARAMS_CACHE_SCOPES
+        _PARAMS_CACHE_SCOPES += 1
+        try:
+            yield
+        finally:
+            _PARAMS_CACHE_SCOPES -= 1
+            if not _PARAMS_CACHE_SCOPES:
+                _fetch_trodes_pos_params.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _fetch_trodes_pos_params(name: str) -> dict:
+    """Fetch params by name. Use TrodesPosParams.fetch_params for a copy."""
+    return (TrodesPosParams & {"trodes_pos_params_name": name}).fetch1("params")
+
 
 @schema
 class TrodesPosSelection(SpyglassMixin, dj.Manual):
@@ -139,13 +178,10 @@ class TrodesPosSelection(SpyglassMixin, dj.Manual):
                 skip_duplicates=skip_duplicates,
             )
 
-        cls.insert(
-            [
-                {**k, param_pk: edit_name or param_name}
-                for k in query.fetch("KEY", as_dict=True)
-            ],
-            skip_duplicates=skip_duplicates,
-        )
+        rows = query.fetch("KEY", as_dict=True)
+        for row in rows:  # Fetched dicts are fresh, set param name in place
+            row[param_pk] = edit_name or param_name
+        cls.insert(rows, skip_duplicates=skip_duplicates)
 
 
 @schema
@@ -163,6 +199,11 @@ class TrodesPosV1(SpyglassMixin, dj.Computed):
     velocity_object_id : varchar(80)
     """
 
+    def populate(self, *restrictions, **kwargs):
+        """Populate, fetching each paramset once per call."""
+        with TrodesPosParams.cached_params():
+            return super().populate(*restrictions, **kwargs)
+
     def make(self, key):
         """Populate the table with position data.
 
@@ -176,21 +217,24 @@ class TrodesPosV1(SpyglassMixin, dj.Computed):
         logger.info(f"Computing position for: {key}")
         orig_key = copy.deepcopy(key)
 
-        analysis_file_name = AnalysisNwbfile().create(  # logged
-            key["nwb_file_name"]
-        )
-
         raw_position = RawPosition.PosObject & key
         spatial_series = raw_position.fetch_nwb()[0]["raw_position"]
         spatial_df = raw_position.fetch1_dataframe()
 
-        position_info_parameters = (TrodesPosParams() & key).fetch1("params")
+        position_info_parameters = TrodesPosParams.fetch_params(
+            key["trodes_pos_params_name"]
+        )
         position_info = self.calculate_position_info(
             spatial_df=spatial_df,
             meters_to_pixels=spatial_series.conversion,
             **position_info_parameters,
         )
 
+        # Create the file only once position info computed without error
+        analysis_file_name = AnalysisNwbfile().create(  # logged
+            key["nwb_file_name"]
+        )
+
         key.update(
             dict(
                 analysis_file_name=analysis_file_name,
@@ -232,14 +276,23 @@ class TrodesPosV1(SpyglassMixin, dj.Computed):
         """Calculate position info from 2D spatial series."""
         return IntervalPositionInfo().calculate_position_info(*args, **kwargs)
 
-    def fetch1_dataframe(self, add_frame_ind=True) -> DataFrame:
-        """Fetch the position data as a pandas DataFrame."""
+    def fetch1_dataframe(
+        self, add_frame_ind=True, include_velocity=True
+    ) -> DataFrame:
+        """Fetch the position data as a pandas DataFrame.
+
+        Parameters
+        ----------
+        add_frame_ind : bool, optional
+            Include the video_frame_ind column. Default True. Ignored for
+            upsampled data.
+        include_velocity : bool, optional
+            Include velocity_x, velocity_y and speed columns. Default True.
+        """
         pos_params = self.fetch1("trodes_pos_params_name")
         if (
             add_frame_ind
-            and (
-                TrodesPosParams & {"trodes_pos_params_name": pos_params}
-            ).fetch1("params")["is_upsampled"]
+            and TrodesPosParams.fetch_params(pos_params)["is_upsampled"]
         ):
             logger.warning(
                 "Upsampled position data, frame indices are invalid. "
@@ -247,7 +300,10 @@ class TrodesPosV1(SpyglassMixin, dj.Computed):
             )
             add_frame_ind = False
         return IntervalPositionInfo._data_to_df(
-            self.fetch_nwb()[0], prefix="", add_frame_ind=add_frame_ind
+            self.fetch_nwb()[0],
+            prefix="",
+            add_frame_ind=add_frame_ind,
+            include_velocity=include_velocity,
         )
 
 
@@ -265,6 +321,11 @@ class TrodesPosVideo(SpyglassMixin, dj.Computed):
     has_video : bool
     """
 
+    def populate(self, *restrictions, **kwargs):
+        """Populate, fetching each paramset once per call."""
+        with TrodesPosParams.cached_params():
+            return super().populate(*restrictions, **kwargs)
+
     def make(self, key):
         """Generate a video with overlaid position data.
 
@@ -284,7 +345,7 @@ class TrodesPosVideo(SpyglassMixin, dj.Computed):
                 "interval_list_name": key["interval_list_name"],
             }
         ).fetch1_dataframe()
-        pos_df = (TrodesPosV1() & key).fetch1_dataframe()
+        pos_df = (TrodesPosV1() & key).fetch1_dataframe(include_velocity=False)
 
         logger.info("Loading video data...")
         epoch = (
@@ -311,15 +372,13 @@ class TrodesPosVideo(SpyglassMixin, dj.Computed):
             return
 
         # Check timepoints overlap
-        if not set(video_time).intersection(set(pos_df.index)):
+        if not np.isin(video_time, pos_df.index.to_numpy()).any():
             raise ValueError(
                 "No overlapping time points between video and position data"
             )
 
         params_pk = "trodes_pos_params_name"
-        params = (TrodesPosParams() & {params_pk: key[params_pk]}).fetch1(
-            "params"
-        )
+        params = TrodesPosParams.fetch_params(key[params_pk])
 
         # Check if upsampled
         if params["is_upsampled"]:
@@ -354,17 +413,11 @@ class TrodesPosVideo(SpyglassMixin, dj.Computed):
         if limit:
             # pytest video data has mismatched shapes in some cases
             min_len = limit or min(len(adj_df), len(pos_df), len(video_time))
-            adj_df = adj_df.head(min_len)
-            pos_df = pos_df.head(min_len)
+            adj_df = adj_df.iloc[:min_len]
+            pos_df = pos_df.iloc[:min_len]
             video_time = video_time[:min_len]
 
-        centroids = {
-            "red": np.asarray(adj_df[["xloc", "yloc"]]),
-            "green": np.asarray(adj_df[["xloc2", "yloc2"]]),
-        }
-        position_mean = np.asarray(pos_df[["position_x", "position_y"]])
-        orientation_mean = np.asarray(pos_df[["orientation"]])
-        position_time = np.asarray(pos_df.index)
+        position_time = pos_df.index.to_numpy(dtype=np.float64)
 
         ind_col = (
             pos_df["video_frame_ind"]
@@ -373,24 +426,27 @@ class TrodesPosVideo(SpyglassMixin, dj.Computed):
         )
         video_frame_inds = ind_col.astype(int).to_numpy()
 
-        centroids = {
-            color: fill_nan(
-                variable=data,
-                video_time=video_time,
-                variable_time=position_time,
-            )
-            for color, data in centroids.items()
-        }
-        position_mean = fill_nan(
-            variable=position_mean,
-            video_time=video_time,
-            variable_time=position_time,
-        )
-        orientation_mean = fill_nan(
-            variable=orientation_mean,
+        # Resample all variables onto video time with one shared index search.
+        # One column selection per DataFrame, stacked as columns:
+        #   red (0:2), green (2:4), position (4:6), orientation (6)
+        centroid_cols = ["xloc", "yloc", "xloc2", "yloc2"]
+        pos_cols = ["position_x", "position_y", "orientation"]
+        filled = fill_nan(
+            variable=np.hstack(
+                (
+                    adj_df[centroid_cols].to_numpy(dtype=np.float64),
+                    pos_df[pos_cols].to_numpy(dtype=np.float64),
+                )
+            ),
             video_time=video_time,
             variable_time=position_time,
         )
+        centroids = {
+            "red": filled[:, 0:2],
+            "green": filled[:, 2:4],
+        }
+        position_mean = filled[:, 4:6]
+        orientation_mean = filled[:, 6:7]
 
         vid_maker = make_video(
             video_filename=video_path,
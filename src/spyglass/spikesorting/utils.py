@@ -284,10 +284,7 @@ def _reformat_metrics(metrics: Dict[str, Dict[str, float]]) -> List[Dict]:
             "name": metric_name,
             "label": metric_name,
             "tooltip": metric_name,
-            "data": {
-                str(unit_id): metric_value
-                for unit_id, metric_value in metric.items()
-            },
+            "data": dict(zip(map(str, metric), metric.values())),
         }
         for metric_name, metric in metrics.items()
     ]
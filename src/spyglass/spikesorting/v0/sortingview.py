@@ -63,18 +63,22 @@ class SortingviewWorkspace(SpyglassMixin, dj.Computed):
         metrics = (Curation & key).fetch1("quality_metrics")
         curation_labels = (Curation & key).fetch1("curation_labels")
         team_name = (SpikeSortingRecording & key).fetch1()["team_name"]
-        team_members = (LabTeam.LabTeamMember & {"team_name": team_name}).fetch(
-            "lab_member_name"
-        )
+        team_query = LabTeam.LabTeamMember & {"team_name": team_name}
+        member_ids = {}  # lab member: google user IDs, from one join
+        for team_member, google_user_id in zip(
+            *(LabMember.LabMemberInfo & team_query).fetch(
+                "lab_member_name", "google_user_name"
+            )
+        ):
+            member_ids.setdefault(team_member, []).append(google_user_id)
         google_user_ids = []
-        for team_member in team_members:
-            google_user_id = (
-                LabMember.LabMemberInfo & {"lab_member_name": team_member}
-            ).fetch("google_user_name")
+        for team_member in team_query.fetch("lab_member_name"):
+            google_user_id = member_ids.get(team_member, [])
             if len(google_user_id) != 1:
                 logger.warning(
-                    f"Google user ID for {team_member} does not exist or more than one ID detected;\
-                        permission not given to {team_member}, skipping..."
+                    f"Google user ID for {team_member} does not exist or "
+                    + "more than one ID detected; permission not given to "
+                    + f"{team_member}, skipping..."
                 )
                 continue
             google_user_ids.append(google_user_id[0])
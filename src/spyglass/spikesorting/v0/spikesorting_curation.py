@@ -1064,20 +1064,25 @@ class CuratedSpikeSorting(SpyglassMixin, dj.Computed):
         del key["units_object_id"]
         del key["analysis_file_name"]
 
-        metric_fields = self.metrics_fields()
+        metric_fields = []
+        for field in self.metrics_fields():
+            if field in final_metrics:
+                metric_fields.append(field)
+            else:
+                logger.warning(
+                    f"No metric named {field} in computed unit quality "
+                    + "metrics; skipping"
+                )
+
+        unit_rows = []
         for unit_id in accepted_units:
-            key["unit_id"] = unit_id
+            unit_row = {**key, "unit_id": unit_id}
             if unit_id in labels:
-                key["label"] = labels[unit_id]
+                unit_row["label"] = labels[unit_id]
             for field in metric_fields:
-                if field in final_metrics:
-                    key[field] = final_metrics[field][unit_id]
-                else:
-                    Warning(
-                        f"No metric named {field} in computed unit quality "
-                        + "metrics; skipping"
-                    )
-            CuratedSpikeSorting.Unit.insert1(key)
+                unit_row[field] = final_metrics[field][unit_id]
+            unit_rows.append(unit_row)
+        CuratedSpikeSorting.Unit.insert(unit_rows)
 
     def metrics_fields(self):
         """Returns a list of the metrics that are currently in the Units table."""
@@ -7,6 +7,8 @@ import pynwb
 import spikeinterface as si
 import spikeinterface.curation as sc
 import spikeinterface.extractors as se
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 from spyglass.common import BrainRegion, Electrode
 from spyglass.common.common_nwbfile import AnalysisNwbfile
@@ -425,25 +427,35 @@ def _write_sorting_to_nwb_with_curation(
 
 
 def _union_intersecting_lists(lists):
-    result = []
+    """Union lists that share any element.
 
-    while lists:
-        first, *rest = lists
-        first = set(first)
-
-        merged = True
-        while merged:
-            merged = False
-            for idx, other in enumerate(rest):
-                if first.intersection(other):
-                    first.update(other)
-                    del rest[idx]
-                    merged = True
-                    break
-
-        result.append(list(first))
-        lists = rest
+    Items are nodes in a graph linking the members of each list, so the
+    unions are its connected components. Groups keep the order in which their
+    items first appear. Empty lists are dropped.
+    """
+    node_ids = {}
+    for lst in lists:
+        for item in lst:
+            node_ids.setdefault(item, len(node_ids))
+    if not node_ids:
+        return []
+
+    rows, cols = [], []
+    for lst in lists:
+        if len(lst):
+            first = node_ids[lst[0]]
+            for item in lst:
+                rows.append(first)
+                cols.append(node_ids[item])
+    n_nodes = len(node_ids)
+    graph = csr_matrix(
+        (np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n_nodes, n_nodes)
+    )
+    n_groups, labels = connected_components(graph, directed=False)
 
+    result = [[] for _ in range(n_groups)]
+    for item, label in zip(node_ids, labels):
+        result[label].append(item)
     return result
 
 
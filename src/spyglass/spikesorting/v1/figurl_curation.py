@@ -1,8 +1,11 @@
 import uuid
-from typing import Any, Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Tuple, Union
 
 import datajoint as dj
 import kachery_cloud as kcl
+import numpy as np
 import pynwb
 import sortingview.views as vv
 import spikeinterface as si
@@ -16,6 +19,10 @@ from spyglass.utils import SpyglassMixin, logger
 
 schema = dj.schema("spikesorting_v1_figurl_curation")
 
+# Recently created SpikeSortingViews, oldest first. See _generate_figurl
+_SORTING_VIEW_CACHE = {}
+_SORTING_VIEW_CACHE_SIZE = 4
+
 
 @schema
 class FigURLCurationSelection(SpyglassMixin, dj.Manual):
@@ -66,22 +73,12 @@ class FigURLCurationSelection(SpyglassMixin, dj.Manual):
         key : dict
             primary key from CurationV1
         """
-        curation_key = (CurationV1 & key).fetch1()
-        analysis_file_abs_path = AnalysisNwbfile.get_abs_path(
-            curation_key["analysis_file_name"]
+        unit_ids, columns = _read_units_columns(
+            *(CurationV1 & key).fetch1("analysis_file_name", "object_id"),
+            columns=["curation_label", "merge_groups"],
         )
-        with pynwb.NWBHDF5IO(
-            analysis_file_abs_path, "r", load_namespaces=True
-        ) as io:
-            nwbfile = io.read()
-            nwb_sorting = nwbfile.objects[
-                curation_key["object_id"]
-            ].to_dataframe()
-            unit_ids = list(nwb_sorting.index)
-            labels = list(nwb_sorting["curation_label"])
-            merge_groups = list(nwb_sorting["merge_groups"])
-
-        unit_ids = [str(unit_id) for unit_id in unit_ids]
+        labels = list(columns["curation_label"])
+        merge_groups = list(columns["merge_groups"])
 
         labels_dict = (
             {unit_id: list(label) for unit_id, label in zip(unit_ids, labels)}
@@ -122,34 +119,25 @@ class FigURLCuration(SpyglassMixin, dj.Computed):
     def make(self, key: dict):
         """Generate a FigURL for manual curation of a spike sorting."""
         # FETCH
-        query = (
-            FigURLCurationSelection * CurationV1 * SpikeSortingSelection & key
-        )
-        (
-            sorting_fname,
-            object_id,
-            recording_label,
-            metrics_figurl,
-        ) = query.fetch1(
-            "analysis_file_name", "object_id", "recording_id", "metrics_figurl"
-        )
+        sel_key = (FigURLCurationSelection & key).fetch1()
+        sorting_fname, object_id, recording_label = (
+            CurationV1 * SpikeSortingSelection & sel_key
+        ).fetch1("analysis_file_name", "object_id", "recording_id")
+        metrics_figurl = sel_key["metrics_figurl"]
+        sorting_label = sel_key["sorting_id"]
+        curation_uri = sel_key["curation_uri"]
 
         # DO
-        sel_query = FigURLCurationSelection & key
-        sel_key = sel_query.fetch1()
-        sorting_fpath = AnalysisNwbfile.get_abs_path(sorting_fname)
         recording = CurationV1.get_recording(sel_key)
         sorting = CurationV1.get_sorting(sel_key)
-        sorting_label = sel_query.fetch1("sorting_id")
-        curation_uri = sel_query.fetch1("curation_uri")
 
-        metric_dict = {}
-        with pynwb.NWBHDF5IO(sorting_fpath, "r", load_namespaces=True) as io:
-            nwbf = io.read()
-            nwb_sorting = nwbf.objects[object_id].to_dataframe()
-            unit_ids = nwb_sorting.index
-            for metric in metrics_figurl:
-                metric_dict[metric] = dict(zip(unit_ids, nwb_sorting[metric]))
+        unit_ids, metrics = _read_units_columns(
+            sorting_fname, object_id, columns=metrics_figurl
+        )
+        metric_dict = {
+            metric: dict(zip(unit_ids, np.asarray(values).tolist()))
+            for metric, values in metrics.items()
+        }
 
         unit_metrics = _reformat_metrics(metric_dict)
 
@@ -163,6 +151,7 @@ class FigURLCuration(SpyglassMixin, dj.Computed):
             recording_label=recording_label,
             sorting_label=sorting_label,
             unit_metrics=unit_metrics,
+            view_cache_key=(recording_label, sorting_fname),
         )
 
         # INSERT
@@ -188,6 +177,32 @@ class FigURLCuration(SpyglassMixin, dj.Computed):
         return kcl.load_json(curation_json).get("mergeGroups", {})
 
 
+def _read_units_columns(
+    analysis_file_name: str, object_id: str, columns: List[str]
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Read unit ids, as str, and the given columns of a units table.
+
+    Column datasets are read directly, rather than converting the whole
+    table, including spike_times, to a DataFrame.
+    """
+    abs_path = AnalysisNwbfile.get_abs_path(analysis_file_name)
+    with pynwb.NWBHDF5IO(abs_path, "r", load_namespaces=True) as io:
+        units = io.read().objects[object_id]
+        unit_ids = [str(unit_id) for unit_id in units.id[:]]
+        return unit_ids, {column: units[column][:] for column in columns}
+
+
+@lru_cache(maxsize=32)
+def _snippet_len(
+    sampling_frequency: float, ms_before: float, ms_after: float
+) -> Tuple[int, int]:
+    """Convert snippet durations in ms to sample counts before and after."""
+    return (
+        int(ms_before * sampling_frequency / 1000),
+        int(ms_after * sampling_frequency / 1000),
+    )
+
+
 def _generate_figurl(
     R: si.BaseRecording,
     S: si.BaseSorting,
@@ -202,73 +217,93 @@ def _generate_figurl(
     channel_neighborhood_size=5,
     raster_plot_subsample_max_firing_rate=50,
     spike_amplitudes_subsample_max_firing_rate=50,
+    view_cache_key: Union[Tuple, None] = None,
 ) -> str:
+    """Generate a FigURL for curation.
+
+    If view_cache_key is given, e.g. recording id and sorting analysis file,
+    the SpikeSortingView is kept in memory and reused for later calls with
+    the same key and view parameters, skipping snippet extraction.
+    """
     logger.info("Preparing spikesortingview data")
     recording = R
     sorting = S
 
     sampling_frequency = recording.get_sampling_frequency()
-
-    this_view = SpikeSortingView.create(
-        recording=recording,
-        sorting=sorting,
+    view_kwargs = dict(
         segment_duration_sec=segment_duration_sec,
-        snippet_len=(
-            int(snippet_ms_before * sampling_frequency / 1000),
-            int(snippet_ms_after * sampling_frequency / 1000),
+        snippet_len=_snippet_len(
+            sampling_frequency, snippet_ms_before, snippet_ms_after
         ),
         max_num_snippets_per_segment=max_num_snippets_per_segment,
         channel_neighborhood_size=channel_neighborhood_size,
     )
 
+    cache_key = (
+        None
+        if view_cache_key is None
+        else (view_cache_key, *sorted(view_kwargs.items()))
+    )
+    this_view = _SORTING_VIEW_CACHE.get(cache_key)
+    if this_view is None:
+        this_view = SpikeSortingView.create(
+            recording=recording, sorting=sorting, **view_kwargs
+        )
+    if cache_key is not None:
+        _SORTING_VIEW_CACHE.pop(cache_key, None)  # Move to most recent
+        _SORTING_VIEW_CACHE[cache_key] = this_view
+        while len(_SORTING_VIEW_CACHE) > _SORTING_VIEW_CACHE_SIZE:
+            _SORTING_VIEW_CACHE.pop(next(iter(_SORTING_VIEW_CACHE)))
+
     # Assemble the views in a layout. Can be replaced with other layouts.
     raster_max_fire = raster_plot_subsample_max_firing_rate
     spike_amp_max_fire = spike_amplitudes_subsample_max_firing_rate
 
-    sort_items = [
-        vv.MountainLayoutItem(
-            label="Summary", view=this_view.sorting_summary_view()
-        ),
-        vv.MountainLayoutItem(
-            label="Units table",
-            view=this_view.units_table_view(
-                unit_ids=this_view.unit_ids, unit_metrics=unit_metrics
-            ),
-        ),
-        vv.MountainLayoutItem(
-            label="Raster plot",
-            view=this_view.raster_plot_view(
-                unit_ids=this_view.unit_ids,
-                _subsample_max_firing_rate=raster_max_fire,
-            ),
+    unit_ids = this_view.unit_ids
+    view_makers = {
+        "Summary": this_view.sorting_summary_view,
+        "Units table": partial(
+            this_view.units_table_view,
+            unit_ids=unit_ids,
+            unit_metrics=unit_metrics,
         ),
-        vv.MountainLayoutItem(
-            label="Spike amplitudes",
-            view=this_view.spike_amplitudes_view(
-                unit_ids=this_view.unit_ids,
-                _subsample_max_firing_rate=spike_amp_max_fire,
-            ),
+        "Raster plot": partial(
+            this_view.raster_plot_view,
+            unit_ids=unit_ids,
+            _subsample_max_firing_rate=raster_max_fire,
         ),
-        vv.MountainLayoutItem(
-            label="Autocorrelograms",
-            view=this_view.autocorrelograms_view(unit_ids=this_view.unit_ids),
+        "Spike amplitudes": partial(
+            this_view.spike_amplitudes_view,
+            unit_ids=unit_ids,
+            _subsample_max_firing_rate=spike_amp_max_fire,
         ),
-        vv.MountainLayoutItem(
-            label="Cross correlograms",
-            view=this_view.cross_correlograms_view(unit_ids=this_view.unit_ids),
+        "Autocorrelograms": partial(
+            this_view.autocorrelograms_view, unit_ids=unit_ids
         ),
-        vv.MountainLayoutItem(
-            label="Avg waveforms",
-            view=this_view.average_waveforms_view(unit_ids=this_view.unit_ids),
+        "Cross correlograms": partial(
+            this_view.cross_correlograms_view, unit_ids=unit_ids
         ),
-        vv.MountainLayoutItem(
-            label="Electrode geometry",
-            view=this_view.electrode_geometry_view(),
+        "Avg waveforms": partial(
+            this_view.average_waveforms_view, unit_ids=unit_ids
         ),
+        "Electrode geometry": this_view.electrode_geometry_view,
+    }
+
+    # Views are independent reads of this_view; numpy releases the GIL
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            label: executor.submit(make_view)
+            for label, make_view in view_makers.items()
+        }
+        sort_items = [
+            vv.MountainLayoutItem(label=label, view=future.result())
+            for label, future in futures.items()
+        ]
+    sort_items.append(
         vv.MountainLayoutItem(
             label="Curation", view=vv.SortingCuration2(), is_control=True
-        ),
-    ]
+        )
+    )
 
     return vv.MountainLayout(items=sort_items).url(
         label=f"{recording_label} {sorting_label}",
@@ -1,6 +1,8 @@
+from functools import lru_cache, reduce
 from inspect import getmodule
 from itertools import chain as iter_chain
-from pprint import pprint
+from operator import add
+from re import compile as re_compile
 from re import sub as re_sub
 from time import time
 from typing import List, Union
@@ -22,6 +24,14 @@ MERGE_DEFINITION = (
     f"\n    {RESERVED_PRIMARY_KEY}: uuid\n    ---\n"
     + f"    {RESERVED_SECONDARY_KEY}: varchar({RESERVED_SK_LENGTH})\n    "
 )
+_MERGE_PARTS_CACHE = {}  # Merge class: (dependency graph size, part tables)
+# Table name conversions repeat over the same few part names
+_to_camel = lru_cache(maxsize=1024)(to_camel_case)
+_from_camel = lru_cache(maxsize=1024)(from_camel_case)
+_SOURCE_RESTR = re_compile(  # whole sql condition is just source = "name"
+    rf"[\s(]*`?{RESERVED_SECONDARY_KEY}`?\s*=\s*"
+    rf"([\"'])(?P<source>[^\"']+)\1[\s)]*"
+)
 
 
 def is_merge_table(table):
@@ -50,6 +60,21 @@ def is_merge_table(table):
     ] and table.heading.secondary_attributes == [RESERVED_SECONDARY_KEY]
 
 
+def _restr_source(restriction, restr_str: str = None) -> Union[str, None]:
+    """Return the source named by a restriction, if any.
+
+    Checks a dict restriction directly, falling back to the sql condition
+    string when it is a single equality on the source field. Conditions
+    that combine it with others (e.g., OR, NOT) return None.
+    """
+    if isinstance(restriction, dict) and RESERVED_SECONDARY_KEY in restriction:
+        return restriction[RESERVED_SECONDARY_KEY]
+    if isinstance(restr_str, str) and RESERVED_SECONDARY_KEY in restr_str:
+        if match := _SOURCE_RESTR.fullmatch(restr_str):
+            return match.group("source")
+    return None
+
+
 class Merge(ExportMixin, dj.Manual):
     """Adds funcs to support standard Merge table operations.
 
@@ -60,10 +85,12 @@ class Merge(ExportMixin, dj.Manual):
     view rather than the master table itself.
     """
 
+    # Class attributes, so classmethods need not instantiate to read them
+    _reserved_pk = RESERVED_PRIMARY_KEY
+    _reserved_sk = RESERVED_SECONDARY_KEY
+
     def __init__(self):
         super().__init__()
-        self._reserved_pk = RESERVED_PRIMARY_KEY
-        self._reserved_sk = RESERVED_SECONDARY_KEY
         if not self.is_declared:
             if not is_merge_table(self):  # Check definition
                 logger.warning(
@@ -85,7 +112,7 @@ class Merge(ExportMixin, dj.Manual):
         """Return the CamelCase name of a part table"""
         if not isinstance(part, str):
             part = part.table_name
-        return to_camel_case(part.split("__")[-1].strip("`"))
+        return _to_camel(part.split("__")[-1].strip("`"))
 
     def get_source_from_key(self, key: dict) -> str:
         """Return the source of a given key"""
@@ -139,36 +166,35 @@ class Merge(ExportMixin, dj.Manual):
             list of datajoint tables, parts of Merge Table
         """
 
-        cls._ensure_dependencies_loaded()
+        if restriction is True or (
+            isinstance(restriction, dict) and not restriction
+        ):  # Unrestricted: skip condition, source lookup and part restricts
+            parts = cls._cached_parts()
+            if not return_empties:
+                parts = [p for p in parts if len(p)]
+            return parts if as_objects else [p.full_table_name for p in parts]
 
         # Normalize restriction to sql string
         restr_str = make_condition(cls(), restriction, set())
 
-        parts_all = cls.parts(as_objects=True)
+        parts_all = cls._cached_parts()
         # If the restriction makes ref to a source, we only want that part
-        if (
-            not return_empties
-            and isinstance(restr_str, str)
-            and f"`{cls()._reserved_sk}`" in restr_str
-        ):
+        source = (
+            None if return_empties else _restr_source(restriction, restr_str)
+        )
+        if source:
             parts_all = [
                 part
                 for part in parts_all
-                if from_camel_case(
-                    restr_str.split(f'`{cls()._reserved_sk}`="')[-1].split('"')[
-                        0
-                    ]
-                )  # Only look at source part table
-                in part.full_table_name
+                if _from_camel(source) in part.full_table_name
             ]
         if isinstance(restriction, dict):  # restr by source already done above
-            _ = restriction.pop(cls()._reserved_sk, None)  # won't work for str
+            _ = restriction.pop(cls._reserved_sk, None)  # won't work for str
             # If a dict restriction has all invalid keys, it is treated as True
             if not add_invalid_restrict:
+                restr_attrs = restriction.keys()
                 parts_all = [  # so exclude tables w/ nonmatching attrs
-                    p
-                    for p in parts_all
-                    if all([k in p.heading.names for k in restriction.keys()])
+                    p for p in parts_all if restr_attrs <= set(p.heading.names)
                 ]
 
         parts = []
@@ -220,24 +246,23 @@ class Merge(ExportMixin, dj.Manual):
             list of datajoint tables, parents of parts of Merge Table
         """
         # .restrict(restriction) does not work on returned part FreeTable
-        # & part.fetch below restricts parent to entries in merge table
-        part_parents = [
-            parent
-            & part.fetch(*part.heading.secondary_attributes, as_dict=True)
-            for part in cls()._merge_restrict_parts(
-                restriction=restriction,
-                return_empties=return_empties,
-                add_invalid_restrict=add_invalid_restrict,
-            )
-            for parent in part.parents(as_objects=True)  # ID respective parents
-            if cls().table_name not in parent.full_table_name  # Not merge table
-        ]
-        if parent_name:
-            part_parents = [
-                p
-                for p in part_parents
-                if from_camel_case(parent_name) in p.full_table_name
+        # & part below restricts parent to entries in merge table, in sql
+        master_name = cls.table_name
+        parent_table = _from_camel(parent_name) if parent_name else ""
+        part_parents = []
+        for part in cls._merge_restrict_parts(
+            restriction=restriction,
+            return_empties=return_empties,
+            add_invalid_restrict=add_invalid_restrict,
+        ):
+            parents = [  # ID respective parents, excluding merge table
+                parent
+                for parent in part.parents(as_objects=True)
+                if master_name not in parent.full_table_name
+                and parent_table in parent.full_table_name
             ]
+            part_keys = part.proj(*part.heading.secondary_attributes)
+            part_parents.extend(parent & part_keys for parent in parents)
         if not as_objects:
             part_parents = [p.full_table_name for p in part_parents]
 
@@ -261,8 +286,9 @@ class Merge(ExportMixin, dj.Manual):
         datajoint.expression.Union
         """
 
+        master = cls()
         parts = [
-            cls() * p  # join with master to include sec key (i.e., 'source')
+            master * p  # join with master to include sec key (i.e., 'source')
             for p in cls._merge_restrict_parts(
                 restriction=restriction,
                 add_invalid_restrict=False,
@@ -280,22 +306,17 @@ class Merge(ExportMixin, dj.Manual):
             )
         }
 
+        all_attrs = dj.U(*attr_dict)  # shared across parts
+
         def _proj_part(part):
             """Project part, adding NULL/0 for missing attributes"""
-            return dj.U(*attr_dict.keys()) * part.proj(
+            part_attrs = frozenset(part.heading.names)  # names rebuilt per call
+            return all_attrs * part.proj(
                 ...,  # include all attributes from part
-                **{
-                    k: v
-                    for k, v in attr_dict.items()
-                    if k not in part.heading.names
-                },
+                **{k: v for k, v in attr_dict.items() if k not in part_attrs},
             )
 
-        query = _proj_part(parts[0])  # start with first part
-        for part in parts[1:]:  # add remaining parts
-            query += _proj_part(part)
-
-        return query
+        return reduce(add, map(_proj_part, parts))  # union of all parts
 
     @classmethod
     def _merge_insert(cls, rows: list, part_name: str = None, **kwargs) -> None:
@@ -319,46 +340,64 @@ class Merge(ExportMixin, dj.Manual):
 
         type_err_msg = "Input `rows` must be a list of dictionaries"
         try:
-            for r in iter(rows):
-                if not isinstance(r, dict):
-                    raise TypeError(type_err_msg)
+            rows = list(rows)  # Iterated again below, so consume once
         except TypeError:
             raise TypeError(type_err_msg)
+        if not all(isinstance(r, dict) for r in rows):
+            raise TypeError(type_err_msg)
 
         parts = cls._merge_restrict_parts(as_objects=True)
         if part_name:
             parts = [
-                p
-                for p in parts
-                if from_camel_case(part_name) in p.full_table_name
+                p for p in parts if _from_camel(part_name) in p.full_table_name
             ]
 
+        reserved_pk, reserved_sk = cls._reserved_pk, cls._reserved_sk
+
+        # Per-part invariants, only for parts whose parent matches any row:
+        #   part parent, source name, and parent keys already in the part
+        part_info = {}
+        for part in parts:
+            part_parent = part.parents(as_objects=True)[-1]
+            if not (parent_hits := part_parent & rows):
+                continue
+            parent_pk = part_parent.primary_key
+            existing = {
+                tuple(k[a] for a in parent_pk)
+                for k in (part & parent_hits.proj()).fetch(
+                    *parent_pk, as_dict=True
+                )
+            }
+            master_sk = {reserved_sk: cls._part_name(part)}
+            part_info[part] = (part_parent, parent_pk, master_sk, existing)
+
         master_entries = []
         parts_entries = {p: [] for p in parts}
         for row in rows:
-            keys = []  # empty to-be-inserted keys
-            for part in parts:  # check each part
-                part_name = cls._part_name(part)
-                part_parent = part.parents(as_objects=True)[-1]
-                if part_parent & row:  # if row is in part parent
-                    keys = (part_parent & row).fetch("KEY")  # get pk
-                    if len(keys) > 1:
-                        raise ValueError(
-                            "Ambiguous entry. Data has mult rows in "
-                            + f"{part_name}:\n\tData:{row}\n\t{keys}"
-                        )
-                    key = keys[0]
-                    if part & key:
-                        logger.info(f"Key already in part {part_name}: {key}")
-                        continue
-                    master_sk = {cls()._reserved_sk: part_name}
-                    uuid = dj.hash.key_hash(key | master_sk)
-                    master_pk = {cls()._reserved_pk: uuid}
-
-                    master_entries.append({**master_pk, **master_sk})
-                    parts_entries[part].append({**master_pk, **key})
-
-            if not keys:
+            found = False
+            for part, info in part_info.items():
+                part_parent, parent_pk, master_sk, existing = info
+                keys = (part_parent & row).fetch("KEY")  # get pk
+                if not keys:  # row is not in this part parent
+                    continue
+                found = True
+                part_name = master_sk[reserved_sk]
+                if len(keys) > 1:
+                    raise ValueError(
+                        "Ambiguous entry. Data has mult rows in "
+                        + f"{part_name}:\n\tData:{row}\n\t{keys}"
+                    )
+                key = keys[0]
+                if tuple(key[a] for a in parent_pk) in existing:
+                    logger.info(f"Key already in part {part_name}: {key}")
+                    continue
+                uuid = dj.hash.key_hash(key | master_sk)
+                master_pk = {reserved_pk: uuid}
+
+                master_entries.append({**master_pk, **master_sk})
+                parts_entries[part].append({**master_pk, **key})
+
+            if not found:
                 raise ValueError(
                     "Non-existing entry in any of the parent tables - Entry: "
                     + f"{row}"
@@ -378,6 +417,22 @@ class Merge(ExportMixin, dj.Manual):
         if not dj.conn.connection.dependencies._loaded:
             dj.conn.connection.dependencies.load()
 
+    @classmethod
+    def _cached_parts(cls) -> list:
+        """Return part tables as objects, cached for the process.
+
+        Part tables are fixed by the schema, so the list is built once per
+        class rather than on every merge operation. Declaring or dropping a
+        table changes the size of the dependency graph, which rebuilds it.
+        """
+        cls._ensure_dependencies_loaded()
+        n_tables = dj.conn.connection.dependencies.number_of_nodes()
+        cached = _MERGE_PARTS_CACHE.get(cls)
+        if cached is None or cached[0] != n_tables:
+            cached = (n_tables, cls.parts(as_objects=True))
+            _MERGE_PARTS_CACHE[cls] = cached
+        return list(cached[1])
+
     def insert(self, rows: list, **kwargs):
         """Merges table specific insert, ensuring data exists in part parents.
 
@@ -396,7 +451,7 @@ class Merge(ExportMixin, dj.Manual):
         self._merge_insert(rows, **kwargs)
 
     @classmethod
-    def merge_view(cls, restriction: str = True):
+    def merge_view(cls, restriction: str = True, limit: int = None):
         """Prints merged view, including null entries for unique columns.
 
         Note: To handle this Union as a table-like object, use `merge_resrict`
@@ -405,19 +460,27 @@ class Merge(ExportMixin, dj.Manual):
         ---------
         restriction: str, optional
             Restriction to apply to the merged view
+        limit: int, optional
+            Number of rows to fetch and print. Default None, uses DataJoint's
+            display.limit.
         """
 
         # If we overwrite `preview`, we then encounter issues with operators
         # getting passed a `Union`, which doesn't have a method we can
         # intercept to manage master/parts
 
-        return pprint(cls._merge_repr(restriction=restriction))
+        query = cls._merge_repr(restriction=restriction)
+        if query is None:  # No parts, already warned
+            return
+        print(query.preview(limit=limit))  # Fetches only the first rows
 
     @classmethod
     def merge_html(cls, restriction: str = True):
-        """Displays HTML in notebooks."""
-
-        return HTML(repr_html(cls._merge_repr(restriction=restriction)))
+        """Displays HTML in notebooks, up to DataJoint's display.limit rows."""
+        query = cls._merge_repr(restriction=restriction)
+        if query is None:  # No parts, already warned
+            return
+        return HTML(repr_html(query))
 
     @classmethod
     def merge_restrict(cls, restriction: str = True) -> dj.U:
@@ -455,12 +518,9 @@ class Merge(ExportMixin, dj.Manual):
         -------
             >>> MergeTable.merge_delete("field = 1")
         """
-        uuids = [
-            {k: v}
-            for entry in cls.merge_restrict(restriction).fetch("KEY")
-            for k, v in entry.items()
-            if k == cls()._reserved_pk
-        ]
+        uuids = cls.merge_restrict(restriction).fetch(
+            cls._reserved_pk, as_dict=True
+        )
         (cls() & uuids).delete(**kwargs)
 
     @classmethod
@@ -538,22 +598,23 @@ class Merge(ExportMixin, dj.Manual):
         restriction = restriction or self.restriction or True
         merge_restriction = self.extract_merge_id(restriction)
 
-        sources = set(
-            (self & merge_restriction).fetch(
-                self._reserved_sk, log_export=False
+        # One query for all merge ids, grouped by source
+        source_keys = {}
+        for merge_id, source in zip(
+            *(self & merge_restriction).fetch(
+                self._reserved_pk, self._reserved_sk, log_export=False
+            )
+        ):
+            source_keys.setdefault(source, []).append(
+                {self._reserved_pk: merge_id}
             )
-        )
         nwb_list = []
         merge_ids = []
-        for source in sources:
-            source_restr = (
-                self
-                & dj.AndList([{self._reserved_sk: source}, merge_restriction])
-            ).fetch("KEY", log_export=False)
-            nwb_list.extend(
+        for source_restr in source_keys.values():
+            nwb_list.extend(  # Narrow to this source's ids, one parent each
                 (self & source_restr)
                 .merge_restrict_class(
-                    restriction,
+                    dj.AndList([restriction, source_restr]),
                     permit_multiple_rows=True,
                     add_invalid_restrict=False,
                 )
@@ -797,13 +858,6 @@ class Merge(ExportMixin, dj.Manual):
         """
         restriction = self.restriction or restriction
 
-        if log_export and self.export_id:
-            self._log_fetch(  # Transforming restriction to merge_id
-                restriction=self.merge_restrict(restriction).fetch(
-                    RESERVED_PRIMARY_KEY, as_dict=True
-                )
-            )
-
         results = []
         parts = self._merge_restrict_parts(
             restriction=restriction,
@@ -812,14 +866,22 @@ class Merge(ExportMixin, dj.Manual):
             add_invalid_restrict=False,
         )
 
+        if log_export and self.export_id:
+            self._log_fetch(  # Transforming restriction to merge_id
+                restriction=[  # Same parts as merge_restrict, without union
+                    merge_key
+                    for part in parts
+                    for merge_key in part.fetch(
+                        RESERVED_PRIMARY_KEY, as_dict=True
+                    )
+                ]
+            )
+
         for part in parts:
             try:
                 results.extend(part.fetch(*attrs, **kwargs))
             except DataJointError as e:
-                logger.warning(
-                    f"{e.args[0]} Skipping "
-                    + to_camel_case(part.table_name.split("__")[-1])
-                )
+                logger.warning(f"{e.args[0]} Skipping " + self._part_name(part))
 
         # Note: this could collapse results like merge_view, but user may call
         # for recarray, pd.DataFrame, or dict, and fetched contents differ if
@@ -16,9 +16,46 @@ def convert_to_pixels(data, frame_size=None, cm_to_pixels=1.0):
     return data / cm_to_pixels
 
 
+def _uniform_step(times, tol=0.25):
+    """Return the sample step if times are within tol steps of a uniform grid.
+
+    Returns None for non-increasing or irregular times.
+    """
+    if len(times) < 2:
+        return None
+    step = (times[-1] - times[0]) / (len(times) - 1)
+    if not step > 0:
+        return None
+    grid = times[0] + step * np.arange(len(times))
+    return step if np.abs(times - grid).max() < tol * step else None
+
+
+def _digitize_sorted(values, bins):
+    """np.digitize for increasing bins, O(1) per value on a uniform grid.
+
+    On a near-uniform grid, the bin is computed directly from the step and
+    corrected by one where jitter moves a bin edge past the value, giving
+    the same result as np.digitize. Falls back to np.digitize otherwise.
+    """
+    step = _uniform_step(bins)
+    if step is None:
+        return np.digitize(values, bins)
+
+    n_bins = len(bins)
+    ind = np.floor((values - bins[0]) / step)
+    ind = np.clip(np.nan_to_num(ind, nan=n_bins), -1, n_bins).astype(int) + 1
+    ind = np.minimum(ind, n_bins)
+    ind[(ind > 0) & (values < bins[np.maximum(ind - 1, 0)])] -= 1
+    ind[(ind < n_bins) & (values >= bins[np.minimum(ind, n_bins - 1)])] += 1
+    ind[np.isnan(values)] = n_bins  # np.digitize sorts nan past the end
+    return ind
+
+
 def fill_nan(variable, video_time, variable_time):
     """Fill in missing values in variable with nans at video_time points."""
-    video_ind = np.digitize(variable_time, video_time[1:])
+    video_ind = _digitize_sorted(
+        np.asarray(variable_time), np.asarray(video_time)[1:]
+    )
 
     n_video_time = len(video_time)
     try:
@@ -19,6 +19,16 @@ def test_param_keys(params_table):
     assert exp == act, "Accepted params do not match default params"
 
 
+def test_fetch_params_copy(params_table):
+    pk = params_table.default_pk
+    with params_table.cached_params():
+        params = params_table.fetch_params(pk["trodes_pos_params_name"])
+        params["is_upsampled"] = "edited"
+        assert params_table.fetch_params(pk["trodes_pos_params_name"]) == (
+            params_table & pk
+        ).fetch1("params"), "Cached params modified by caller"
+
+
 @pytest.fixture(scope="session")
 def sel_table(teardown, params_table, trodes_sel_table, pos_interval_key):
     new_name = "led_back"
@@ -108,3 +108,13 @@ def test_curation_sort_metric(spike_v1, pop_curation, pop_curation_metric):
         assert (
             sort_metric[k] == expected[k]
         ), f"CurationV1.get_sort_group_info unexpected value: {k}"
+
+
+def test_merge_dict_to_list():
+    from spyglass.spikesorting.v1.curation import _merge_dict_to_list
+
+    merge_dict = {1: [2], 2: [3], 4: [5], 5: [], 6: []}
+    assert _merge_dict_to_list(merge_dict) == [
+        [1, 2, 3],
+        [4, 5],
+    ], "Unexpected merge groups"
@@ -90,3 +90,27 @@ def test_merge_get_class_invalid(caplog, merge_table):
     _ = merge_table.merge_get_parent_class("bad")
     txt = caplog.text
     assert "No source" in txt, "Warning not caught."
+
+
+def test_cached_parts(merge_table):
+    cached = merge_table._cached_parts()
+    cached.pop()  # Callers get a copy, leaving the cache intact
+    assert [p.full_table_name for p in merge_table._cached_parts()] == [
+        p.full_table_name for p in merge_table.parts(as_objects=True)
+    ], "Cached parts differ from parts."
+
+
+def test_restr_source():
+    from spyglass.utils.dj_merge_tables import _restr_source
+
+    assert _restr_source({"source": "A"}) == "A", "Dict source not found."
+    assert (
+        _restr_source(True, "(`source` = 'B')") == "B"
+    ), "String source not found."
+    assert _restr_source(True, '`data_source`="C"') is None, "False match."
+    for restr_str in [
+        "(`source` = 'B') AND (x=1)",
+        'source="A" OR source="B"',
+        'NOT source="A"',
+    ]:
+        assert _restr_source(True, restr_str) is None, "Compound matched."
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def digitize_sorted():
+    from spyglass.utils.position import _digitize_sorted
+
+    return _digitize_sorted
+
+
+@pytest.fixture(scope="module")
+def jittered_bins():
+    from spyglass.utils.position import _uniform_step
+
+    rng = np.random.default_rng(0)
+    step = 1 / 30
+    bins = 100 + step * np.arange(1000)
+    bins += rng.uniform(-0.1, 0.1, size=bins.size) * step
+    assert _uniform_step(bins), "Jittered bins not treated as uniform"
+    return bins
+
+
+def _assert_matches(digitize_sorted, values, bins):
+    np.testing.assert_array_equal(
+        digitize_sorted(values, bins),
+        np.digitize(values, bins),
+        err_msg="Does not match np.digitize",
+    )
+
+
+def test_digitize_sorted_jittered(digitize_sorted, jittered_bins):
+    rng = np.random.default_rng(1)
+    values = rng.uniform(jittered_bins[0] - 1, jittered_bins[-1] + 1, 10_000)
+    _assert_matches(digitize_sorted, values, jittered_bins)
+
+
+def test_digitize_sorted_edges(digitize_sorted, jittered_bins):
+    values = np.concatenate(
+        [
+            jittered_bins,  # exactly on each edge
+            np.nextafter(jittered_bins, -np.inf),  # just below each edge
+            np.nextafter(jittered_bins, np.inf),  # just above each edge
+        ]
+    )
+    _assert_matches(digitize_sorted, values, jittered_bins)
+
+
+def test_digitize_sorted_nonfinite(digitize_sorted, jittered_bins):
+    values = np.array([np.nan, np.inf, -np.inf, jittered_bins[5], np.nan])
+    _assert_matches(digitize_sorted, values, jittered_bins)
+
+
+def test_digitize_sorted_irregular(digitize_sorted):
+    rng = np.random.default_rng(2)
+    bins = np.cumsum(rng.exponential(size=500))
+    values = np.concatenate(
+        [rng.uniform(bins[0] - 1, bins[-1] + 1, 5000), bins, [np.nan]]
+    )
+    _assert_matches(digitize_sorted, values, bins)